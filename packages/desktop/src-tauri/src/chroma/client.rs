@@ -88,11 +88,30 @@ pub struct ChromaClient {
 /// Global client instance
 static CLIENT: RwLock<Option<ChromaClient>> = RwLock::new(None);
 
+/// Cache of collection name → info. get_collection() runs before nearly
+/// every read operation, and without the cache each lookup paid a full
+/// list_collections round trip just to find one name. Collection ids are
+/// stable for the lifetime of a collection, so entries only need to be
+/// dropped on delete or client reset. Misses are never cached: a missing
+/// collection may be created moments later.
+static COLLECTION_CACHE: OnceLock<RwLock<std::collections::HashMap<String, CollectionInfo>>> =
+    OnceLock::new();
+
+fn collection_cache() -> &'static RwLock<std::collections::HashMap<String, CollectionInfo>> {
+    COLLECTION_CACHE.get_or_init(|| RwLock::new(std::collections::HashMap::new()))
+}
+
 impl ChromaClient {
     pub fn new(base_url: &str) -> Self {
         let http = Client::builder()
             .timeout(Duration::from_secs(30))
             .connect_timeout(Duration::from_secs(5))
+            // Keep warm connections to the local Chroma server between
+            // commands so bursts (indexing, queries) skip TCP setup, and
+            // disable Nagle since requests are small and latency-bound
+            .pool_max_idle_per_host(8)
+            .pool_idle_timeout(Duration::from_secs(300))
+            .tcp_nodelay(true)
             .build()
             .unwrap_or_else(|_| Client::new());
         Self {
@@ -227,13 +246,28 @@ impl ChromaClient {
         }
 
         info!(name = %name, "Collection get_or_create");
-        serde_json::from_str(&text)
-            .map_err(|e| ChromaError::Deserialize(format!("{}: {}", e, text)))
+        let info: CollectionInfo = serde_json::from_str(&text)
+            .map_err(|e| ChromaError::Deserialize(format!("{}: {}", e, text)))?;
+        collection_cache().write().insert(info.name.clone(), info.clone());
+        Ok(info)
     }
 
     /// Get a collection by name (read-only, does not create)
     pub async fn get_collection(&self, name: &str) -> Result<CollectionInfo, ChromaError> {
+        if let Some(info) = collection_cache().read().get(name) {
+            return Ok(info.clone());
+        }
+
         let collections = self.list_collections().await?;
+
+        // Populate the cache with everything the listing returned, not just
+        // the requested name - the other collections are usually next
+        let mut cache = collection_cache().write();
+        for c in &collections {
+            cache.insert(c.name.clone(), c.clone());
+        }
+        drop(cache);
+
         collections.into_iter()
             .find(|c| c.name == name)
             .ok_or_else(|| ChromaError::CollectionNotFound(name.to_string()))
@@ -249,9 +283,11 @@ impl ChromaClient {
         let resp = self.http.delete(&url).send().await?;
 
         if resp.status().as_u16() == 404 {
+            collection_cache().write().remove(name);
             warn!(name = %name, "Collection already deleted (404)");
             Ok(())
         } else if resp.status().is_success() {
+            collection_cache().write().remove(name);
             info!(name = %name, "Deleted collection");
             Ok(())
         } else {
@@ -551,6 +587,8 @@ pub fn get_client() -> ChromaClient {
 pub fn reset_client() {
     let mut client = CLIENT.write();
     *client = None;
+    // A new server means new collection ids
+    collection_cache().write().clear();
 }
 
 // ============ TAURI COMMANDS ============
@@ -56,6 +56,13 @@ pub struct NoteIndex {
     pub modified: DateTime<Utc>,
     /// Token count estimate
     pub token_count: u32,
+    /// Lowercased title, precomputed at index time so keyword search does
+    /// not re-lowercase every note per query. Not sent to the frontend.
+    #[serde(skip)]
+    pub title_lower: String,
+    /// Lowercased tags, precomputed for the same reason
+    #[serde(skip)]
+    pub tags_lower: Vec<String>,
 }
 
 /// Full vault index
@@ -69,6 +76,10 @@ pub struct VaultIndex {
     pub title_to_path: HashMap<String, String>,
     /// Tag to paths mapping
     pub tag_to_paths: HashMap<String, Vec<String>>,
+    /// Inverted index: title token to note paths, for keyword search
+    pub title_token_to_paths: HashMap<String, Vec<String>>,
+    /// Inverted index: summary token to note paths, for keyword search
+    pub summary_token_to_paths: HashMap<String, Vec<String>>,
     /// Last full in-memory index timestamp
     pub last_indexed: DateTime<Utc>,
     /// Last successful Chroma index timestamp (for incremental indexing)
@@ -82,64 +93,45 @@ impl VaultIndex {
             notes: HashMap::new(),
             title_to_path: HashMap::new(),
             tag_to_paths: HashMap::new(),
+            title_token_to_paths: HashMap::new(),
+            summary_token_to_paths: HashMap::new(),
             last_indexed: Utc::now(),
             // Use epoch so first index_vault_to_chroma captures all notes
             last_chroma_indexed: DateTime::<Utc>::default(),
         }
     }
 
-    /// Index a single note file
-    fn index_note(&mut self, path: &Path) -> Result<(), ObsidianError> {
-        let content = fs::read_to_string(path)?;
-        let relative_path = path.strip_prefix(&self.vault_path)
-            .map(|p| p.to_string_lossy().to_string())
-            .unwrap_or_else(|_| path.to_string_lossy().to_string());
-
-        let title = path.file_stem()
-            .map(|s| s.to_string_lossy().to_string())
-            .unwrap_or_else(|| relative_path.clone());
-
-        // Extract first paragraph as summary
-        let summary = extract_summary(&content);
-
-        // Extract links [[target]] or [[target|alias]]
-        let links = extract_links(&content);
-
-        // Extract tags #tag
-        let tags = extract_tags(&content);
-
-        // Get file metadata
-        let metadata = fs::metadata(path)?;
-        let modified: DateTime<Utc> = metadata.modified()
-            .map(|t| t.into())
-            .unwrap_or_else(|_| Utc::now());
-
-        // Estimate tokens (~4 chars per token)
-        let token_count = (content.len() as f64 / 4.0).ceil() as u32;
-
-        let note = NoteIndex {
-            path: relative_path.clone(),
-            title: title.clone(),
-            summary,
-            links,
-            tags: tags.clone(),
-            backlinks: Vec::new(), // Filled in second pass
-            modified,
-            token_count,
-        };
-
-        // Update mappings
-        self.title_to_path.insert(title.to_lowercase(), relative_path.clone());
+    /// Merge a parsed note into the index maps
+    fn insert_note(&mut self, note: NoteIndex) {
+        self.title_to_path.insert(note.title_lower.clone(), note.path.clone());
 
-        for tag in &tags {
+        for tag in &note.tags {
             self.tag_to_paths
                 .entry(tag.clone())
                 .or_insert_with(Vec::new)
-                .push(relative_path.clone());
+                .push(note.path.clone());
+        }
+
+        // Posting lists for keyword search. Tokens are deduplicated per note
+        // so a term can contribute at most one hit per note, matching the
+        // old contains() semantics.
+        let title_tokens: std::collections::HashSet<String> = search_tokens(&note.title).collect();
+        for token in title_tokens {
+            self.title_token_to_paths
+                .entry(token)
+                .or_insert_with(Vec::new)
+                .push(note.path.clone());
+        }
+        let summary_tokens: std::collections::HashSet<String> =
+            search_tokens(&note.summary).collect();
+        for token in summary_tokens {
+            self.summary_token_to_paths
+                .entry(token)
+                .or_insert_with(Vec::new)
+                .push(note.path.clone());
         }
 
-        self.notes.insert(relative_path, note);
-        Ok(())
+        self.notes.insert(note.path.clone(), note);
     }
 
     /// Build backlink graph (second pass)
@@ -190,14 +182,95 @@ impl VaultIndex {
     }
 }
 
+/// Parse a single note file into its index entry.
+/// Touches no shared state, so calls can run on worker threads.
+fn parse_note(vault_path: &Path, path: &Path) -> Result<NoteIndex, ObsidianError> {
+    let content = fs::read_to_string(path)?;
+    let relative_path = path.strip_prefix(vault_path)
+        .map(|p| p.to_string_lossy().to_string())
+        .unwrap_or_else(|_| path.to_string_lossy().to_string());
+
+    let title = path.file_stem()
+        .map(|s| s.to_string_lossy().to_string())
+        .unwrap_or_else(|| relative_path.clone());
+
+    // Extract first paragraph as summary
+    let summary = extract_summary(&content);
+
+    // Extract links [[target]] or [[target|alias]]
+    let links = extract_links(&content);
+
+    // Extract tags #tag
+    let tags = extract_tags(&content);
+
+    // Get file metadata
+    let metadata = fs::metadata(path)?;
+    let modified: DateTime<Utc> = metadata.modified()
+        .map(|t| t.into())
+        .unwrap_or_else(|_| Utc::now());
+
+    // Estimate tokens (~4 chars per token)
+    let token_count = (content.len() as f64 / 4.0).ceil() as u32;
+
+    let title_lower = title.to_lowercase();
+    let tags_lower = tags.iter().map(|t| t.to_lowercase()).collect();
+
+    Ok(NoteIndex {
+        path: relative_path,
+        title,
+        summary,
+        links,
+        tags,
+        backlinks: Vec::new(), // Filled in second pass
+        modified,
+        token_count,
+        title_lower,
+        tags_lower,
+    })
+}
+
+/// Tokenize text for the inverted search index: lowercased alphanumeric runs.
+/// Query-side term extraction must use the same tokenization.
+pub fn search_tokens(text: &str) -> impl Iterator<Item = String> + '_ {
+    text.split(|c: char| !c.is_alphanumeric())
+        .filter(|t| !t.is_empty())
+        .map(|t| t.to_lowercase())
+}
+
+/// Skip YAML frontmatter, returning the body that follows the closing fence.
+/// Scans line-by-line only until the fence closes, instead of splitting the
+/// whole document on "---" (which also misfired on horizontal rules and
+/// literal "---" later in the body).
+fn skip_frontmatter(content: &str) -> &str {
+    let after_open = match content.strip_prefix("---") {
+        Some(rest) => rest,
+        None => return content,
+    };
+    let first_newline = match after_open.find('\n') {
+        Some(pos) => pos,
+        None => return content,
+    };
+    // The opening fence must be alone on its line
+    if !after_open[..first_newline].trim().is_empty() {
+        return content;
+    }
+
+    let body = &after_open[first_newline + 1..];
+    let mut offset = 0;
+    for line in body.split_inclusive('\n') {
+        if line.trim_end() == "---" {
+            return &body[offset + line.len()..];
+        }
+        offset += line.len();
+    }
+
+    // Unclosed fence: treat the file as having no frontmatter
+    content
+}
+
 /// Extract first paragraph as summary
 fn extract_summary(content: &str) -> String {
-    // Skip YAML frontmatter if present
-    let content = if content.starts_with("---") {
-        content.split("---").nth(2).unwrap_or(content).trim()
-    } else {
-        content.trim()
-    };
+    let content = skip_frontmatter(content).trim();
 
     // Get first non-empty paragraph
     content.split("\n\n")
@@ -217,40 +290,31 @@ fn extract_summary(content: &str) -> String {
         .unwrap_or_default()
 }
 
-/// Extract [[links]] from content
+/// Extract [[links]] from content.
+/// Walks the string with substring searches so link text is borrowed
+/// straight from the content, without collecting the whole note into a
+/// character buffer first.
 fn extract_links(content: &str) -> Vec<String> {
     let mut links = Vec::new();
-    let mut in_link = false;
-    let mut current_link = String::new();
-
-    let chars: Vec<char> = content.chars().collect();
-    let mut i = 0;
-
-    while i < chars.len() {
-        if i + 1 < chars.len() && chars[i] == '[' && chars[i + 1] == '[' {
-            in_link = true;
-            current_link.clear();
-            i += 2;
-            continue;
-        }
+    let mut rest = content;
 
-        if i + 1 < chars.len() && chars[i] == ']' && chars[i + 1] == ']' {
-            if in_link && !current_link.is_empty() {
-                // Remove alias: [[target|alias]] -> target
-                let target = current_link.split('|').next().unwrap_or(&current_link);
-                links.push(target.to_string());
-            }
-            in_link = false;
-            current_link.clear();
-            i += 2;
-            continue;
-        }
+    while let Some(open) = rest.find("[[") {
+        rest = &rest[open + 2..];
+        let close = match rest.find("]]") {
+            Some(pos) => pos,
+            None => break,
+        };
 
-        if in_link {
-            current_link.push(chars[i]);
+        // A nested opener restarts the link, matching the old scanner:
+        // only the text after the last [[ counts
+        let inner = rest[..close].rsplit("[[").next().unwrap_or("");
+        if !inner.is_empty() {
+            // Remove alias: [[target|alias]] -> target
+            let target = inner.split('|').next().unwrap_or(inner);
+            links.push(target.to_string());
         }
 
-        i += 1;
+        rest = &rest[close + 2..];
     }
 
     links
@@ -367,35 +431,44 @@ struct ChromaUpsertItem {
 /// Index the vault into Chroma for semantic search (best-effort, non-blocking).
 /// Only re-indexes notes modified since the last successful index.
 pub async fn index_vault_to_chroma() -> u32 {
-    let notes_data: Vec<(String, String, String, Vec<String>, u32, String)> = {
+    // Snapshot metadata under the lock; file reads happen after it drops
+    let (vault_path, notes_meta): (PathBuf, Vec<(String, String, String, Vec<String>, u32, String)>) = {
         let index = VAULT_INDEX.read();
         match index.as_ref() {
             Some(vault) => {
                 let cutoff = vault.last_chroma_indexed;
-                vault.notes.values()
+                let meta = vault.notes.values()
                     .filter(|note| note.modified > cutoff)
-                    .map(|note| {
-                        // Read the full content for Chroma indexing
-                        let full_path = vault.vault_path.join(&note.path);
-                        let content = fs::read_to_string(&full_path).unwrap_or_else(|_| note.summary.clone());
-                        (
-                            note.path.clone(),
-                            note.title.clone(),
-                            content,
-                            note.tags.clone(),
-                            note.token_count,
-                            note.modified.to_rfc3339(),
-                        )
-                    }).collect()
+                    .map(|note| (
+                        note.path.clone(),
+                        note.title.clone(),
+                        note.summary.clone(),
+                        note.tags.clone(),
+                        note.token_count,
+                        note.modified.to_rfc3339(),
+                    )).collect();
+                (vault.vault_path.clone(), meta)
             }
-            None => Vec::new(),
+            None => return 0,
         }
     };
 
-    if notes_data.is_empty() {
+    if notes_meta.is_empty() {
         return 0;
     }
 
+    // Read note bodies with the index lock released. The reads are the slow
+    // part of this pass, and holding the read lock across file I/O blocked
+    // watcher re-indexing and mention resolution for its whole duration.
+    let notes_data: Vec<(String, String, String, Vec<String>, u32, String)> = notes_meta
+        .into_iter()
+        .map(|(path, title, summary, tags, token_count, modified)| {
+            let full_path = vault_path.join(&path);
+            let content = fs::read_to_string(&full_path).unwrap_or(summary);
+            (path, title, content, tags, token_count, modified)
+        })
+        .collect();
+
     let client = crate::chroma::client::get_client();
     let collection = match client.get_or_create_collection(
         crate::chroma::collections::COLLECTION_OBSIDIAN, None
@@ -476,10 +549,62 @@ pub fn index_vault() -> Result<IndexStats, ObsidianError> {
     vault.notes.clear();
     vault.title_to_path.clear();
     vault.tag_to_paths.clear();
+    vault.title_token_to_paths.clear();
+    vault.summary_token_to_paths.clear();
 
     // Walk the vault directory
     let mut stats = IndexStats::default();
-    index_directory(&vault.vault_path.clone(), vault, &mut stats)?;
+    let mut note_paths = Vec::new();
+    collect_note_paths(&vault.vault_path.clone(), &mut note_paths)?;
+
+    // Parse notes on worker threads: each parse is an independent file read
+    // plus string scanning, so threads overlap I/O waits with parsing.
+    // Merging into the shared index maps stays serial.
+    let vault_path = vault.vault_path.clone();
+    let workers = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1);
+
+    let parsed: Vec<Result<NoteIndex, String>> = if workers < 2 || note_paths.len() < 2 {
+        note_paths.iter()
+            .map(|p| parse_note(&vault_path, p).map_err(|e| format!("{}: {}", p.display(), e)))
+            .collect()
+    } else {
+        let chunk_size = note_paths.len().div_ceil(workers);
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = note_paths.chunks(chunk_size)
+                .map(|chunk| {
+                    let vault_path = &vault_path;
+                    scope.spawn(move || {
+                        chunk.iter()
+                            .map(|p| parse_note(vault_path, p)
+                                .map_err(|e| format!("{}: {}", p.display(), e)))
+                            .collect::<Vec<_>>()
+                    })
+                })
+                .collect();
+
+            handles.into_iter()
+                .flat_map(|handle| match handle.join() {
+                    Ok(results) => results,
+                    Err(_) => {
+                        warn!("Vault indexing worker panicked");
+                        Vec::new()
+                    }
+                })
+                .collect()
+        })
+    };
+
+    for result in parsed {
+        match result {
+            Ok(note) => {
+                vault.insert_note(note);
+                stats.notes_indexed += 1;
+            }
+            Err(e) => stats.errors.push(e),
+        }
+    }
 
     // Build backlinks
     vault.build_backlinks();
@@ -490,8 +615,8 @@ pub fn index_vault() -> Result<IndexStats, ObsidianError> {
     Ok(stats)
 }
 
-/// Recursively index a directory
-fn index_directory(dir: &Path, index: &mut VaultIndex, stats: &mut IndexStats) -> Result<(), ObsidianError> {
+/// Recursively collect markdown note paths under a directory
+fn collect_note_paths(dir: &Path, paths: &mut Vec<PathBuf>) -> Result<(), ObsidianError> {
     for entry in fs::read_dir(dir)? {
         let entry = entry?;
         let path = entry.path();
@@ -505,14 +630,9 @@ fn index_directory(dir: &Path, index: &mut VaultIndex, stats: &mut IndexStats) -
         }
 
         if path.is_dir() {
-            index_directory(&path, index, stats)?;
+            collect_note_paths(&path, paths)?;
         } else if path.extension().map(|e| e == "md").unwrap_or(false) {
-            match index.index_note(&path) {
-                Ok(()) => stats.notes_indexed += 1,
-                Err(e) => {
-                    stats.errors.push(format!("{}: {}", path.display(), e));
-                }
-            }
+            paths.push(path);
         }
     }
 
@@ -525,6 +645,18 @@ pub fn get_vault_index() -> Result<VaultIndex, ObsidianError> {
     index.clone().ok_or(ObsidianError::NotConfigured)
 }
 
+/// Run a closure against the vault index under the read lock.
+/// Hot query paths use this to borrow the index in place instead of paying
+/// get_vault_index()'s deep clone of every note and posting list per call.
+/// The closure must not take the vault index write lock.
+pub fn with_vault_index<T>(f: impl FnOnce(&VaultIndex) -> T) -> Result<T, ObsidianError> {
+    let index = VAULT_INDEX.read();
+    match index.as_ref() {
+        Some(vault) => Ok(f(vault)),
+        None => Err(ObsidianError::NotConfigured),
+    }
+}
+
 /// Index statistics
 #[derive(Debug, Clone, Default, Serialize, Deserialize)]
 #[serde(rename_all = "camelCase")]
@@ -582,6 +714,18 @@ mod tests {
         assert_eq!(extract_summary(content), "Actual content here.");
     }
 
+    #[test]
+    fn test_skip_frontmatter_ignores_horizontal_rules() {
+        let content = "---\ntitle: Test\n---\n\nFirst paragraph.\n\n---\n\nAfter a rule.";
+        assert_eq!(extract_summary(content), "First paragraph.");
+    }
+
+    #[test]
+    fn test_skip_frontmatter_unclosed() {
+        let content = "---\ntitle: never closed\n\nBody text.";
+        assert_eq!(skip_frontmatter(content), content);
+    }
+
     #[test]
     fn test_extract_links() {
         let content = "Check out [[other note]] and [[folder/nested|nested note]].";
@@ -3,7 +3,8 @@
 //! Handles @ mention resolution and semantic search over the vault index.
 
 use serde::{Deserialize, Serialize};
-use super::indexer::{get_vault_index, NoteIndex, ObsidianError};
+use super::indexer::{search_tokens, with_vault_index, NoteIndex, ObsidianError, VaultIndex};
+use std::collections::HashMap;
 use std::fs;
 use tracing::{debug, warn};
 
@@ -54,64 +55,64 @@ pub struct NoteContent {
 /// - `@note-title` - title search
 /// - `@#tag` - tag search (returns multiple)
 pub fn resolve_mention(mention: &str) -> Result<Vec<NoteIndex>, ObsidianError> {
-    let index = get_vault_index()?;
-
     // Remove @ prefix
     let query = mention.trim_start_matches('@');
 
-    // Tag search
-    if query.starts_with('#') {
-        let tag = query;
-        if let Some(paths) = index.tag_to_paths.get(tag) {
-            return Ok(paths.iter()
-                .filter_map(|p| index.notes.get(p).cloned())
-                .collect());
+    // Borrow the index under the read lock and clone out only the matched
+    // notes, rather than deep-copying the whole index per mention
+    with_vault_index(|index| {
+        // Tag search
+        if query.starts_with('#') {
+            let tag = query;
+            if let Some(paths) = index.tag_to_paths.get(tag) {
+                return paths.iter()
+                    .filter_map(|p| index.notes.get(p).cloned())
+                    .collect();
+            }
+            return Vec::new();
         }
-        return Ok(Vec::new());
-    }
 
-    // Path search (notes/...)
-    if query.starts_with("notes/") || query.contains('/') {
-        let path = if query.ends_with(".md") {
-            query.to_string()
-        } else {
-            format!("{}.md", query)
-        };
+        // Path search (notes/...)
+        if query.starts_with("notes/") || query.contains('/') {
+            let path = if query.ends_with(".md") {
+                query.to_string()
+            } else {
+                format!("{}.md", query)
+            };
 
-        if let Some(note) = index.notes.get(&path) {
-            return Ok(vec![note.clone()]);
-        }
+            if let Some(note) = index.notes.get(&path) {
+                return vec![note.clone()];
+            }
 
-        // Try without notes/ prefix
-        let path_without_prefix = query.trim_start_matches("notes/");
-        let path = if path_without_prefix.ends_with(".md") {
-            path_without_prefix.to_string()
-        } else {
-            format!("{}.md", path_without_prefix)
-        };
+            // Try without notes/ prefix
+            let path_without_prefix = query.trim_start_matches("notes/");
+            let path = if path_without_prefix.ends_with(".md") {
+                path_without_prefix.to_string()
+            } else {
+                format!("{}.md", path_without_prefix)
+            };
 
-        if let Some(note) = index.notes.get(&path) {
-            return Ok(vec![note.clone()]);
+            if let Some(note) = index.notes.get(&path) {
+                return vec![note.clone()];
+            }
         }
-    }
 
-    // Title search
-    let query_lower = query.to_lowercase();
+        // Title search
+        let query_lower = query.to_lowercase();
 
-    // Exact title match
-    if let Some(path) = index.title_to_path.get(&query_lower) {
-        if let Some(note) = index.notes.get(path) {
-            return Ok(vec![note.clone()]);
+        // Exact title match
+        if let Some(path) = index.title_to_path.get(&query_lower) {
+            if let Some(note) = index.notes.get(path) {
+                return vec![note.clone()];
+            }
         }
-    }
-
-    // Partial title match
-    let matches: Vec<_> = index.notes.values()
-        .filter(|n| n.title.to_lowercase().contains(&query_lower))
-        .cloned()
-        .collect();
 
-    Ok(matches)
+        // Partial title match
+        index.notes.values()
+            .filter(|n| n.title_lower.contains(&query_lower))
+            .cloned()
+            .collect()
+    })
 }
 
 /// Semantic search over Obsidian notes via Chroma
@@ -161,50 +162,54 @@ pub async fn query_notes_semantic(
         }
     };
 
-    let index = match get_vault_index() {
-        Ok(idx) => idx,
-        Err(e) => {
-            warn!(error = %e, "Obsidian semantic search: failed to get vault index");
-            return Vec::new();
-        }
-    };
+    let lookup = with_vault_index(|index| {
+        let mut results = Vec::new();
 
-    let mut results = Vec::new();
+        for (query_idx, ids) in result.ids.iter().enumerate() {
+            for (result_idx, _id) in ids.iter().enumerate() {
+                let metadata = result.metadatas.as_ref()
+                    .and_then(|m| m.get(query_idx))
+                    .and_then(|m| m.get(result_idx))
+                    .and_then(|m| m.clone());
 
-    for (query_idx, ids) in result.ids.iter().enumerate() {
-        for (result_idx, _id) in ids.iter().enumerate() {
-            let metadata = result.metadatas.as_ref()
-                .and_then(|m| m.get(query_idx))
-                .and_then(|m| m.get(result_idx))
-                .and_then(|m| m.clone());
+                let distance = result.distances.as_ref()
+                    .and_then(|d| d.get(query_idx))
+                    .and_then(|d| d.get(result_idx))
+                    .copied()
+                    .unwrap_or(f32::MAX);
 
-            let distance = result.distances.as_ref()
-                .and_then(|d| d.get(query_idx))
-                .and_then(|d| d.get(result_idx))
-                .copied()
-                .unwrap_or(f32::MAX);
+                let path = metadata.as_ref()
+                    .and_then(|m| m.get("path"))
+                    .and_then(|v| v.as_str())
+                    .unwrap_or("");
 
-            let path = metadata.as_ref()
-                .and_then(|m| m.get("path"))
-                .and_then(|v| v.as_str())
-                .unwrap_or("");
+                let relevance = 1.0 / (1.0 + distance);
 
-            let relevance = 1.0 / (1.0 + distance);
+                if relevance < SEMANTIC_RELEVANCE_THRESHOLD {
+                    debug!(path = %path, relevance = relevance, "Filtered low-relevance semantic result");
+                    continue;
+                }
 
-            if relevance < SEMANTIC_RELEVANCE_THRESHOLD {
-                debug!(path = %path, relevance = relevance, "Filtered low-relevance semantic result");
-                continue;
+                if let Some(note) = index.notes.get(path) {
+                    results.push(QueryResult {
+                        note: note.clone(),
+                        relevance,
+                        match_type: MatchType::Content,
+                    });
+                }
             }
+        }
 
-            if let Some(note) = index.notes.get(path) {
-                results.push(QueryResult {
-                    note: note.clone(),
-                    relevance,
-                    match_type: MatchType::Content,
-                });
-            }
+        results
+    });
+
+    let results = match lookup {
+        Ok(results) => results,
+        Err(e) => {
+            warn!(error = %e, "Obsidian semantic search: failed to get vault index");
+            return Vec::new();
         }
-    }
+    };
 
     debug!(query = %query, n_results = n_results, hits = results.len(), "Obsidian semantic search");
     results
@@ -212,83 +217,108 @@ pub async fn query_notes_semantic(
 
 /// Query notes with fuzzy matching and relevance scoring
 pub fn query_notes(query: &str, budget: u32) -> Result<Vec<QueryResult>, ObsidianError> {
-    let index = get_vault_index()?;
     let query_lower = query.to_lowercase();
-    let query_terms: Vec<&str> = query_lower.split_whitespace().collect();
+    // Tokenized the same way as the posting lists were built
+    let query_terms: Vec<String> = search_tokens(query).collect();
+
+    // Score under the read lock, borrowing the index in place. Cloning the
+    // index out would copy every note plus the posting lists per query,
+    // which would swamp the inverted-index lookups below.
+    let mut results = with_vault_index(|index| {
+        // Accumulate term hits from the inverted index up front: per-query work
+        // is proportional to the posting lists the terms touch, instead of
+        // lowercasing and substring-scanning every note's title and summary
+        let mut title_hits: HashMap<&str, u32> = HashMap::new();
+        let mut summary_hits: HashMap<&str, u32> = HashMap::new();
+        for term in &query_terms {
+            if let Some(paths) = index.title_token_to_paths.get(term.as_str()) {
+                for path in paths {
+                    *title_hits.entry(path.as_str()).or_insert(0) += 1;
+                }
+            }
+            if let Some(paths) = index.summary_token_to_paths.get(term.as_str()) {
+                for path in paths {
+                    *summary_hits.entry(path.as_str()).or_insert(0) += 1;
+                }
+            }
+        }
 
-    let mut results: Vec<QueryResult> = Vec::new();
-    let mut total_tokens = 0u32;
+        let mut results: Vec<QueryResult> = Vec::new();
+        let mut total_tokens = 0u32;
 
-    // Score each note
-    for note in index.notes.values() {
-        let mut relevance = 0.0f32;
-        let mut match_type = MatchType::Content;
+        // Score each note
+        for note in index.notes.values() {
+            let mut relevance = 0.0f32;
+            let mut match_type = MatchType::Content;
 
-        // Exact title match (highest)
-        if note.title.to_lowercase() == query_lower {
-            relevance = 1.0;
-            match_type = MatchType::ExactTitle;
-        }
-        // Partial title match
-        else if note.title.to_lowercase().contains(&query_lower) {
-            relevance = 0.8;
-            match_type = MatchType::PartialTitle;
-        }
-        // Tag match
-        else if note.tags.iter().any(|t| t.to_lowercase().contains(&query_lower)) {
-            relevance = 0.7;
-            match_type = MatchType::Tag;
-        }
-        // Term matching in title/summary
-        else {
-            let title_lower = note.title.to_lowercase();
-            let summary_lower = note.summary.to_lowercase();
-
-            let title_matches = query_terms.iter()
-                .filter(|t| title_lower.contains(*t))
-                .count();
-            let summary_matches = query_terms.iter()
-                .filter(|t| summary_lower.contains(*t))
-                .count();
-
-            if title_matches > 0 || summary_matches > 0 {
-                relevance = (title_matches as f32 * 0.3 + summary_matches as f32 * 0.1)
-                    / query_terms.len() as f32;
+            // Exact title match (highest)
+            if note.title_lower == query_lower {
+                relevance = 1.0;
+                match_type = MatchType::ExactTitle;
             }
-        }
-
-        if relevance > 0.0 {
-            // Check budget
-            if total_tokens + note.token_count > budget {
-                continue;
+            // Partial title match
+            else if note.title_lower.contains(&query_lower) {
+                relevance = 0.8;
+                match_type = MatchType::PartialTitle;
+            }
+            // Tag match
+            else if note.tags_lower.iter().any(|t| t.contains(&query_lower)) {
+                relevance = 0.7;
+                match_type = MatchType::Tag;
             }
+            // Term matching in title/summary, served by the inverted index.
+            // Terms now match whole tokens rather than arbitrary substrings,
+            // which also stops short terms from hitting inside unrelated words.
+            else if !query_terms.is_empty() {
+                let title_matches = title_hits.get(note.path.as_str()).copied().unwrap_or(0);
+                let summary_matches = summary_hits.get(note.path.as_str()).copied().unwrap_or(0);
+
+                if title_matches > 0 || summary_matches > 0 {
+                    relevance = (title_matches as f32 * 0.3 + summary_matches as f32 * 0.1)
+                        / query_terms.len() as f32;
+                }
+            }
+
+            if relevance > 0.0 {
+                // Check budget
+                if total_tokens + note.token_count > budget {
+                    continue;
+                }
 
-            total_tokens += note.token_count;
+                total_tokens += note.token_count;
 
-            results.push(QueryResult {
-                note: note.clone(),
-                relevance,
-                match_type,
-            });
+                results.push(QueryResult {
+                    note: note.clone(),
+                    relevance,
+                    match_type,
+                });
+            }
         }
-    }
 
-    // Sort by relevance
-    results.sort_by(|a, b| b.relevance.partial_cmp(&a.relevance).unwrap_or(std::cmp::Ordering::Equal));
+        results
+    })?;
+
+    // Sort by relevance, after the read lock is released. Unstable sort
+    // skips the stable merge sort's temporary buffer, and total_cmp avoids
+    // the per-comparison NaN check.
+    results.sort_unstable_by(|a, b| b.relevance.total_cmp(&a.relevance));
 
     Ok(results)
 }
 
 /// Get note content with optional truncation to budget
 pub fn get_note_content(path: &str, max_tokens: u32) -> Result<NoteContent, ObsidianError> {
-    let index = get_vault_index()?;
-
-    let note = index.notes.get(path)
-        .ok_or_else(|| ObsidianError::NoteNotFound(path.to_string()))?;
-
-    let full_path = index.vault_path.join(path);
+    // Snapshot the title and vault path under the read lock; the filesystem
+    // work below does not need the index (or a deep copy of it)
+    let (title, vault_path) = with_vault_index(|index| {
+        index.notes.get(path)
+            .map(|note| (note.title.clone(), index.vault_path.clone()))
+    })?
+    .ok_or_else(|| ObsidianError::NoteNotFound(path.to_string()))?;
+
+    let full_path = vault_path.join(path);
     // Validate the resolved path stays within the vault
-    let canonical_vault = index.vault_path.canonicalize()
+    let canonical_vault = vault_path.canonicalize()
         .map_err(|e| ObsidianError::Io(e))?;
     let canonical_path = full_path.canonicalize()
         .map_err(|e| ObsidianError::Io(e))?;
@@ -324,7 +354,7 @@ pub fn get_note_content(path: &str, max_tokens: u32) -> Result<NoteContent, Obsi
 
     Ok(NoteContent {
         path: path.to_string(),
-        title: note.title.clone(),
+        title,
         content: final_content,
         token_count: final_token_count,
         truncated,
@@ -333,8 +363,17 @@ pub fn get_note_content(path: &str, max_tokens: u32) -> Result<NoteContent, Obsi
 
 /// Get notes by backlink relationship
 pub fn get_related_notes(path: &str, depth: u8) -> Result<Vec<NoteIndex>, ObsidianError> {
-    let index = get_vault_index()?;
+    // A single read-lock acquisition covers the whole traversal; recursing
+    // through the lock would instead deep-copy the index once per level
+    with_vault_index(|index| collect_related_notes(index, path, depth))?
+}
 
+/// Recursive worker for [`get_related_notes`], borrowing the locked index
+fn collect_related_notes(
+    index: &VaultIndex,
+    path: &str,
+    depth: u8,
+) -> Result<Vec<NoteIndex>, ObsidianError> {
     let note = index.notes.get(path)
         .ok_or_else(|| ObsidianError::NoteNotFound(path.to_string()))?;
 
@@ -344,7 +383,7 @@ pub fn get_related_notes(path: &str, depth: u8) -> Result<Vec<NoteIndex>, Obsidi
 
     // Add direct links and backlinks
     for link in &note.links {
-        if let Some(target_path) = resolve_link_to_path(&index, link) {
+        if let Some(target_path) = resolve_link_to_path(index, link) {
             if visited.insert(target_path.clone()) {
                 if let Some(n) = index.notes.get(&target_path) {
                     related.push(n.clone());
@@ -365,7 +404,7 @@ pub fn get_related_notes(path: &str, depth: u8) -> Result<Vec<NoteIndex>, Obsidi
     if depth > 1 {
         let direct_related: Vec<_> = related.iter().map(|n| n.path.clone()).collect();
         for related_path in direct_related {
-            if let Ok(deeper) = get_related_notes(&related_path, depth - 1) {
+            if let Ok(deeper) = collect_related_notes(index, &related_path, depth - 1) {
                 for n in deeper {
                     if visited.insert(n.path.clone()) {
                         related.push(n);
@@ -379,7 +418,7 @@ pub fn get_related_notes(path: &str, depth: u8) -> Result<Vec<NoteIndex>, Obsidi
 }
 
 /// Resolve a link reference to a path
-fn resolve_link_to_path(index: &super::indexer::VaultIndex, link: &str) -> Option<String> {
+fn resolve_link_to_path(index: &VaultIndex, link: &str) -> Option<String> {
     // Try exact path match
     if index.notes.contains_key(link) {
         return Some(link.to_string());
@@ -414,14 +453,26 @@ pub async fn obsidian_query_notes_semantic(
     budget: u32,
     n_results: u32,
 ) -> Result<Vec<QueryResult>, ObsidianError> {
-    // Get keyword results
-    let mut keyword_results = query_notes(&query, budget)?;
-    let keyword_count = keyword_results.len();
+    // The two legs are independent: the keyword scan is CPU-bound over the
+    // vault index while the semantic leg waits on Chroma. Run the scan on a
+    // blocking worker concurrently with the network round trip instead of
+    // paying for them back to back.
+    let keyword_query = query.clone();
+    let keyword_task =
+        tokio::task::spawn_blocking(move || query_notes(&keyword_query, budget));
 
-    // Get semantic results from Chroma
     let semantic_results = query_notes_semantic(&query, n_results).await;
     let semantic_count = semantic_results.len();
 
+    let mut keyword_results = match keyword_task.await {
+        Ok(result) => result?,
+        Err(e) => {
+            warn!(error = %e, "Obsidian keyword search task failed");
+            Vec::new()
+        }
+    };
+    let keyword_count = keyword_results.len();
+
     // Merge: dedup by path, keep highest relevance
     let mut seen_paths: std::collections::HashSet<String> = keyword_results.iter()
         .map(|r| r.note.path.clone())
@@ -434,7 +485,7 @@ pub async fn obsidian_query_notes_semantic(
     }
 
     // Re-sort by relevance
-    keyword_results.sort_by(|a, b| b.relevance.partial_cmp(&a.relevance).unwrap_or(std::cmp::Ordering::Equal));
+    keyword_results.sort_unstable_by(|a, b| b.relevance.total_cmp(&a.relevance));
 
     debug!(keyword_hits = keyword_count, semantic_hits = semantic_count, merged = keyword_results.len(), "Obsidian merged search");
 
@@ -103,7 +103,7 @@ pub fn obsidian_start_watching(app: AppHandle, vault_path: String) -> Result<(),
         .map_err(|_| ObsidianError::InvalidPath("Cannot resolve vault path".to_string()))?;
 
     // Verify this is the currently configured vault
-    if let Some(configured_vault) = super::indexer::get_vault_index().ok().map(|i| i.vault_path) {
+    if let Ok(configured_vault) = super::indexer::with_vault_index(|i| i.vault_path.clone()) {
         let configured_canonical = configured_vault.canonicalize()
             .map_err(|_| ObsidianError::InvalidPath("Cannot resolve configured vault path".to_string()))?;
         if canonical_path != configured_canonical {
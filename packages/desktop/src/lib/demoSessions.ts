@@ -0,0 +1,118 @@
+/**
+ * Demo sessions for dev mode - provides sample data for demos
+ *
+ * Lives in its own module (loaded via dynamic import) so the sample data
+ * stays out of the startup module graph; only the DEV-mode empty-board
+ * path ever pulls it in.
+ */
+
+import type { Session, SessionState, SessionCategory } from '../components/Kanban'
+
+export function createDemoSessions(): Session[] {
+  const now = new Date()
+  const hourAgo = new Date(now.getTime() - 60 * 60 * 1000)
+  const dayAgo = new Date(now.getTime() - 24 * 60 * 60 * 1000)
+  const twoDaysAgo = new Date(now.getTime() - 2 * 24 * 60 * 60 * 1000)
+  const weekAgo = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000)
+
+  const defaults = { passCount: 0, contextFileCount: 0, isProjectLocal: false }
+
+  return [
+    // SPARK column (backlog)
+    {
+      id: 'demo-session-1',
+      title: 'DeepSeek R1 vs OpenAI o1',
+      category: 'ai-infrastructure' as SessionCategory,
+      state: 'backlog' as SessionState,
+      mode: 'idea' as const,
+      claimCount: 0,
+      tensionCount: 0,
+      summary: 'Compare reasoning capabilities and cost structures',
+      createdAt: hourAgo,
+      updatedAt: hourAgo,
+      ...defaults,
+    },
+    {
+      id: 'demo-session-2',
+      title: 'Tariff Impact on TSMC',
+      category: 'geopolitical' as SessionCategory,
+      state: 'backlog' as SessionState,
+      mode: 'decision' as const,
+      claimCount: 0,
+      tensionCount: 0,
+      summary: 'Analyze supply chain risks from new trade policies',
+      createdAt: dayAgo,
+      updatedAt: dayAgo,
+      ...defaults,
+    },
+    // EXPLORE column
+    {
+      id: 'demo-session-3',
+      title: 'Nvidia Blackwell Demand Signals',
+      category: 'ai-infrastructure' as SessionCategory,
+      state: 'exploring' as SessionState,
+      mode: 'idea' as const,
+      claimCount: 8,
+      tensionCount: 1,
+      summary: 'Tracking enterprise adoption and hyperscaler orders',
+      createdAt: twoDaysAgo,
+      updatedAt: hourAgo,
+      ...defaults,
+    },
+    {
+      id: 'demo-session-4',
+      title: 'Grid Capacity for AI Datacenters',
+      category: 'energy-power' as SessionCategory,
+      state: 'exploring' as SessionState,
+      mode: 'decision' as const,
+      claimCount: 12,
+      tensionCount: 2,
+      summary: 'Power constraints vs compute buildout trajectories',
+      createdAt: weekAgo,
+      updatedAt: dayAgo,
+      ...defaults,
+    },
+    // TENSIONS column
+    {
+      id: 'demo-session-5',
+      title: 'China AI Chip Self-Sufficiency',
+      category: 'geopolitical' as SessionCategory,
+      state: 'tensions' as SessionState,
+      mode: 'idea' as const,
+      claimCount: 15,
+      tensionCount: 4,
+      summary: 'SMIC progress vs export control effectiveness',
+      createdAt: weekAgo,
+      updatedAt: twoDaysAgo,
+      ...defaults,
+    },
+    // FORMING column
+    {
+      id: 'demo-session-6',
+      title: 'Microsoft Copilot ROI Thesis',
+      category: 'ai-infrastructure' as SessionCategory,
+      state: 'synthesizing' as SessionState,
+      mode: 'decision' as const,
+      claimCount: 18,
+      tensionCount: 3,
+      summary: 'Enterprise productivity gains vs subscription costs',
+      createdAt: weekAgo,
+      updatedAt: dayAgo,
+      ...defaults,
+    },
+    // SHIP column (formed)
+    {
+      id: 'demo-session-7',
+      title: 'Renewable Intermittency Solutions',
+      category: 'energy-power' as SessionCategory,
+      state: 'formed' as SessionState,
+      mode: 'idea' as const,
+      claimCount: 22,
+      tensionCount: 0,
+      summary: 'Battery storage and grid flexibility technologies',
+      createdAt: weekAgo,
+      updatedAt: twoDaysAgo,
+      ...defaults,
+    },
+  ]
+}
@@ -72,27 +72,28 @@ const MARKER_TO_SECTION: Record<MarkerType, ScratchpadSection['type']> = {
  * Create a new scratchpad
  */
 export function createScratchpad(sessionId: string, title: string): Scratchpad {
+  const now = Date.now()
   return {
     sessionId,
     title,
     sections: [
-      { id: 'claims', type: 'claims', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'insights', type: 'insights', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'evidence', type: 'evidence', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'risks', type: 'risks', content: [], lastUpdated: Date.now(), preserved: false },
-      { id: 'counters', type: 'counters', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'questions', type: 'questions', content: [], lastUpdated: Date.now(), preserved: false },
-      { id: 'patterns', type: 'patterns', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'decisions', type: 'decisions', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'tensions', type: 'tensions', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'meta', type: 'meta', content: [], lastUpdated: Date.now(), preserved: false },
+      { id: 'claims', type: 'claims', content: [], lastUpdated: now, preserved: true },
+      { id: 'insights', type: 'insights', content: [], lastUpdated: now, preserved: true },
+      { id: 'evidence', type: 'evidence', content: [], lastUpdated: now, preserved: true },
+      { id: 'risks', type: 'risks', content: [], lastUpdated: now, preserved: false },
+      { id: 'counters', type: 'counters', content: [], lastUpdated: now, preserved: true },
+      { id: 'questions', type: 'questions', content: [], lastUpdated: now, preserved: false },
+      { id: 'patterns', type: 'patterns', content: [], lastUpdated: now, preserved: true },
+      { id: 'decisions', type: 'decisions', content: [], lastUpdated: now, preserved: true },
+      { id: 'tensions', type: 'tensions', content: [], lastUpdated: now, preserved: true },
+      { id: 'meta', type: 'meta', content: [], lastUpdated: now, preserved: false },
     ],
     confidenceHistory: [],
     currentConfidence: 0.5,
     cycleCount: 0,
     tokenEstimate: 0,
-    created: Date.now(),
-    lastUpdated: Date.now(),
+    created: now,
+    lastUpdated: now,
     currentStage: 'gather',
     essay: '',
     userQuotes: [],
@@ -105,6 +106,7 @@ export function createScratchpad(sessionId: string, title: string): Scratchpad {
 export function extractAndMerge(scratchpad: Scratchpad, expansionText: string): Scratchpad {
   const updated = { ...scratchpad, sections: [...scratchpad.sections] }
   const now = Date.now()
+  let changed = false
 
   // Extract content for each marker type
   for (const [marker, regex] of Object.entries(SEMANTIC_MARKERS)) {
@@ -112,18 +114,34 @@ export function extractAndMerge(scratchpad: Scratchpad, expansionText: string):
     const sectionIndex = updated.sections.findIndex(s => s.type === sectionType)
     if (sectionIndex === -1) continue
 
-    const section = { ...updated.sections[sectionIndex] }
-    const matches = expansionText.matchAll(new RegExp(regex))
+    const section = updated.sections[sectionIndex]
+    // matchAll clones the regex internally; no per-call RegExp copy needed
+    const matches = expansionText.matchAll(regex)
 
+    // Collect additions first, then copy the content array once - the old
+    // per-match spread rebuilt the whole array for every new item
+    let additions: string[] | null = null
     for (const match of matches) {
       const content = match[1].trim()
-      if (content && !section.content.includes(content)) {
-        section.content = [...section.content, content]
-        section.lastUpdated = now
+      if (content && !section.content.includes(content) && !additions?.includes(content)) {
+        (additions ??= []).push(content)
       }
     }
 
-    updated.sections[sectionIndex] = section
+    if (additions) {
+      updated.sections[sectionIndex] = {
+        ...section,
+        content: section.content.concat(additions),
+        lastUpdated: now,
+      }
+      changed = true
+    }
+  }
+
+  // No new markers: return the original object so callers can detect the
+  // empty delta by identity and skip downstream work
+  if (!changed) {
+    return scratchpad
   }
 
   // Update token estimate
@@ -227,9 +245,11 @@ export function renderScratchpad(scratchpad: Scratchpad): string {
 
   // Confidence trajectory (from EXP-004 - non-monotonic reveals genuine exploration)
   if (scratchpad.confidenceHistory.length > 0) {
-    const trajectory = [...scratchpad.confidenceHistory, scratchpad.currentConfidence]
+    // Append the current value directly rather than copying the history
+    // into a throwaway combined array
+    const trajectory = scratchpad.confidenceHistory
       .map(c => (c * 100).toFixed(0) + '%')
-      .join(' → ')
+      .join(' → ') + ' → ' + (scratchpad.currentConfidence * 100).toFixed(0) + '%'
     sections.push(`Trajectory: ${trajectory}`)
   }
 
@@ -262,13 +282,15 @@ export function checkTermination(scratchpad: Scratchpad, maxCycles: number = 5):
     return null
   }
 
-  const history = [...scratchpad.confidenceHistory, scratchpad.currentConfidence]
+  // The trajectory is history plus the current value; only its last three
+  // entries matter here, so read them in place instead of building the
+  // combined array
+  const history = scratchpad.confidenceHistory
 
   // Saturation: delta_confidence < 0.05 for 2 cycles
-  if (history.length >= 3) {
-    const recent = history.slice(-3)
-    const delta1 = Math.abs(recent[1] - recent[0])
-    const delta2 = Math.abs(recent[2] - recent[1])
+  if (history.length >= 2) {
+    const delta1 = Math.abs(history[history.length - 1] - history[history.length - 2])
+    const delta2 = Math.abs(scratchpad.currentConfidence - history[history.length - 1])
     if (delta1 < 0.05 && delta2 < 0.05) {
       return 'confidence_saturated'
     }
@@ -296,27 +318,34 @@ export function analyzeTrajectory(scratchpad: Scratchpad): {
   maxDip: number
   finalTrend: 'increasing' | 'decreasing' | 'stable'
 } {
-  const history = [...scratchpad.confidenceHistory, scratchpad.currentConfidence]
-  if (history.length < 2) {
+  // Trajectory = history entries followed by the current value; index
+  // through both in place rather than concatenating them into a new array
+  const history = scratchpad.confidenceHistory
+  const total = history.length + 1
+  if (total < 2) {
     return { isMonotonic: true, maxDip: 0, finalTrend: 'stable' }
   }
 
+  const at = (i: number): number =>
+    i < history.length ? history[i] : scratchpad.currentConfidence
+
   let isMonotonic = true
   let maxDip = 0
-  let maxSoFar = history[0]
+  let maxSoFar = at(0)
 
-  for (let i = 1; i < history.length; i++) {
-    if (history[i] < history[i - 1]) {
+  for (let i = 1; i < total; i++) {
+    const value = at(i)
+    if (value < at(i - 1)) {
       isMonotonic = false
-      const dip = maxSoFar - history[i]
+      const dip = maxSoFar - value
       if (dip > maxDip) maxDip = dip
     }
-    maxSoFar = Math.max(maxSoFar, history[i])
+    maxSoFar = Math.max(maxSoFar, value)
   }
 
   // Final trend from last 2 points
-  const last = history[history.length - 1]
-  const prev = history[history.length - 2]
+  const last = at(total - 1)
+  const prev = at(total - 2)
   const finalTrend = last > prev + 0.03 ? 'increasing'
     : last < prev - 0.03 ? 'decreasing'
     : 'stable'
@@ -368,14 +397,15 @@ export function addClaims(scratchpad: Scratchpad, claims: string[]): Scratchpad
   const claimsSection = scratchpad.sections.find(s => s.type === 'claims')
   if (!claimsSection) return scratchpad
 
+  const now = Date.now()
   const updated = { ...scratchpad, sections: [...scratchpad.sections] }
   const sectionIndex = updated.sections.findIndex(s => s.type === 'claims')
   updated.sections[sectionIndex] = {
     ...claimsSection,
     content: [...claimsSection.content, ...claims],
-    lastUpdated: Date.now(),
+    lastUpdated: now,
   }
-  updated.lastUpdated = Date.now()
+  updated.lastUpdated = now
   return updated
 }
 
@@ -386,14 +416,15 @@ export function addTension(scratchpad: Scratchpad, tension: string): Scratchpad
   const tensionsSection = scratchpad.sections.find(s => s.type === 'tensions')
   if (!tensionsSection) return scratchpad
 
+  const now = Date.now()
   const updated = { ...scratchpad, sections: [...scratchpad.sections] }
   const sectionIndex = updated.sections.findIndex(s => s.type === 'tensions')
   updated.sections[sectionIndex] = {
     ...tensionsSection,
     content: [...tensionsSection.content, tension],
-    lastUpdated: Date.now(),
+    lastUpdated: now,
   }
-  updated.lastUpdated = Date.now()
+  updated.lastUpdated = now
   return updated
 }
 
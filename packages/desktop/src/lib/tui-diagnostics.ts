@@ -60,6 +60,12 @@ interface EscapeLoggerOptions {
 // DIAGNOSTICS
 // ──────────────────────────────────────────────
 
+// Hoisted out of the write hook: a regex literal allocates a fresh RegExp
+// object every time it is evaluated, and the hook runs on every PTY write.
+// Both flicker-indicating sequences live in one alternation so each write
+// is scanned once; the named group tells the two kinds apart.
+const FLICKER_SEQUENCE_REGEX = /(?<erase>\x1b\[2K)|\x1b\[\d*A/g
+
 type Disposable = IDisposable | (() => void)
 
 export class TUIDiagnostics {
@@ -172,8 +178,12 @@ export class TUIDiagnostics {
       reportAccum.bytes += str.length
 
       // Count flicker-indicating sequences
-      const erases = (str.match(/\x1b\[2K/g) || []).length
-      const cursorUps = (str.match(/\x1b\[\d*A/g) || []).length
+      let erases = 0
+      let cursorUps = 0
+      for (const match of str.matchAll(FLICKER_SEQUENCE_REGEX)) {
+        if (match.groups?.erase) erases++
+        else cursorUps++
+      }
       self._metrics.eraseCount += erases
       self._metrics.cursorMoveCount += cursorUps
       reportAccum.erases += erases
@@ -397,6 +407,40 @@ export function cleanupOnProcessExit(terminal: Terminal): void {
 // RAW ESCAPE SEQUENCE LOGGER
 // ──────────────────────────────────────────────
 
+// Hoisted for the same reason as the write-hook patterns above
+const ESC_BYTE_REGEX = /\x1b/g
+const CURSOR_POSITION_REGEX = /\\e\[\d+;\d+H/g
+
+const KNOWN_SEQUENCES: Record<string, string> = {
+  '\\e[2K': 'ERASE_LINE',
+  '\\e[2J': 'ERASE_SCREEN',
+  '\\e[3J': 'ERASE_SCROLLBACK',
+  '\\e[?1049h': 'ALT_SCREEN_ON',
+  '\\e[?1049l': 'ALT_SCREEN_OFF',
+  '\\e[?25h': 'CURSOR_SHOW',
+  '\\e[?25l': 'CURSOR_HIDE',
+  '\\e[?2026h': 'SYNC_BEGIN',
+  '\\e[?2026l': 'SYNC_END',
+  '\\e[?2004h': 'BRACKETED_PASTE_ON',
+  '\\e[?2004l': 'BRACKETED_PASTE_OFF',
+  '\\e[?1000h': 'MOUSE_ON',
+  '\\e[?1000l': 'MOUSE_OFF',
+  '\\e[0m': 'RESET_ATTRS',
+  '\\ec': 'HARD_RESET',
+  '\\e[!p': 'SOFT_RESET',
+}
+
+// One alternation over every known sequence, so each log call scans the
+// data once instead of once per table entry. Longest-first keeps prefixes
+// (e.g. \e[2K vs \e[2J) from shadowing longer sequences.
+const KNOWN_SEQUENCE_REGEX = new RegExp(
+  Object.keys(KNOWN_SEQUENCES)
+    .sort((a, b) => b.length - a.length)
+    .map(p => p.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'))
+    .join('|'),
+  'g'
+)
+
 /**
  * Logs raw escape sequences in human-readable form.
  * Useful for understanding exactly what a TUI app is sending.
@@ -406,25 +450,6 @@ export class EscapeSequenceLogger {
   private filter: RegExp | null
   private onSequence: (seq: string) => void
 
-  private readonly _knownSequences: Record<string, string> = {
-    '\\e[2K': 'ERASE_LINE',
-    '\\e[2J': 'ERASE_SCREEN',
-    '\\e[3J': 'ERASE_SCROLLBACK',
-    '\\e[?1049h': 'ALT_SCREEN_ON',
-    '\\e[?1049l': 'ALT_SCREEN_OFF',
-    '\\e[?25h': 'CURSOR_SHOW',
-    '\\e[?25l': 'CURSOR_HIDE',
-    '\\e[?2026h': 'SYNC_BEGIN',
-    '\\e[?2026l': 'SYNC_END',
-    '\\e[?2004h': 'BRACKETED_PASTE_ON',
-    '\\e[?2004l': 'BRACKETED_PASTE_OFF',
-    '\\e[?1000h': 'MOUSE_ON',
-    '\\e[?1000l': 'MOUSE_OFF',
-    '\\e[0m': 'RESET_ATTRS',
-    '\\ec': 'HARD_RESET',
-    '\\e[!p': 'SOFT_RESET',
-  }
-
   constructor(options: EscapeLoggerOptions = {}) {
     this.maxLogLength = options.maxLogLength ?? 500
     this.filter = options.filter ?? null
@@ -433,21 +458,24 @@ export class EscapeSequenceLogger {
 
   log(data: string | Uint8Array): void {
     const str = typeof data === 'string' ? data : new TextDecoder().decode(data)
-    const escaped = str.replace(/\x1b/g, '\\e')
+    const escaped = str.replace(ESC_BYTE_REGEX, '\\e')
 
     if (this.filter && !this.filter.test(escaped)) return
 
-    // Identify known sequences
+    // Identify known sequences in a single pass over the data
+    const counts = new Map<string, number>()
+    for (const match of escaped.matchAll(KNOWN_SEQUENCE_REGEX)) {
+      const name = KNOWN_SEQUENCES[match[0]]
+      counts.set(name, (counts.get(name) ?? 0) + 1)
+    }
+
     const annotations: string[] = []
-    for (const [pattern, name] of Object.entries(this._knownSequences)) {
-      const count = escaped.split(pattern).length - 1
-      if (count > 0) {
-        annotations.push(`${name}×${count}`)
-      }
+    for (const [name, count] of counts) {
+      annotations.push(`${name}×${count}`)
     }
 
     // Count cursor moves
-    const cursorMoves = (escaped.match(/\\e\[\d+;\d+H/g) || []).length
+    const cursorMoves = (escaped.match(CURSOR_POSITION_REGEX) || []).length
     if (cursorMoves > 0) annotations.push(`CURSOR_MOVE×${cursorMoves}`)
 
     if (annotations.length > 0) {
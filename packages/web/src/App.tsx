@@ -1,4 +1,4 @@
-import { useState, useCallback, useEffect } from 'react'
+import { useState, useCallback, useEffect, useRef } from 'react'
 import { TerminalPanel } from './components/Terminal'
 import type { CommandBlockData } from './components/Terminal'
 import { KanbanBoard, stateLabels } from './components/Kanban'
@@ -384,6 +384,11 @@ Example: \`analyze "Should I invest in companies building context graphs?"\``,
     setBlocks(prev => [...prev, newBlock])
   }, [])
 
+  // Draft generation is kicked off concurrently with question generation at
+  // ingest time (both depend only on the claims); this holds the in-flight
+  // promise so the post-interview flow can await it instead of starting over
+  const draftPrefetchRef = useRef<Promise<DraftThesis> | null>(null)
+
   // Generate draft thesis after ingest (new flow)
   const generateDraft = useCallback(async (result: IngestResult, blockId: string) => {
     if (!result.claims.length) return
@@ -391,7 +396,18 @@ Example: \`analyze "Should I invest in companies building context graphs?"\``,
     setDraftState(prev => ({ ...prev, isGenerating: true, error: null }))
 
     try {
-      const draft = await generateDraftThesis(result.claims)
+      let draft: DraftThesis
+      if (draftPrefetchRef.current) {
+        try {
+          draft = await draftPrefetchRef.current
+        } catch {
+          // Prefetch failed (e.g. transient network error) - retry fresh
+          draft = await generateDraftThesis(result.claims)
+        }
+        draftPrefetchRef.current = null
+      } else {
+        draft = await generateDraftThesis(result.claims)
+      }
 
       setDraftState(prev => ({
         ...prev,
@@ -529,7 +545,16 @@ Click **Source** tab to view claims. Answer the interview questions in the left
       )
     )
 
-    // Generate interview questions (interview must complete before thesis)
+    // Generate interview questions and prefetch the draft thesis in
+    // parallel - both depend only on the extracted claims, so there is no
+    // reason to wait for the interview before starting the draft call
+    if (result.claims.length > 0) {
+      const prefetch = generateDraftThesis(result.claims)
+      // Swallow here to avoid an unhandled rejection; generateDraft
+      // re-surfaces failures when it actually awaits the result
+      prefetch.catch(() => {})
+      draftPrefetchRef.current = prefetch
+    }
     generateInterviewQuestions(result)
   }, [generateInterviewQuestions])
 
@@ -1282,8 +1307,13 @@ Switch to **Source** view to see highlighted passages.`,
                     : b
                 )
               )
-              // Trigger interview generation
+              // Trigger interview generation, prefetching the draft
+              // thesis in parallel as the ingest path does - both calls
+              // depend only on the fresh claims
               if (claims.length > 0) {
+                const prefetch = generateDraftThesis(claims)
+                prefetch.catch(() => {})
+                draftPrefetchRef.current = prefetch
                 generateInterviewQuestions({ ...ingestState.result!, claims })
               }
             } catch (err) {
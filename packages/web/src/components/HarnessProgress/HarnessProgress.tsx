@@ -8,6 +8,7 @@
  * - Final synthesis with semantic markers preserved
  */
 
+import { useMemo } from 'react'
 import type { PassType } from '../../lib/api'
 import type { HarnessResult, HarnessStatus } from '../../lib/useHarness'
 
@@ -148,7 +149,11 @@ export function HarnessProgress({
   onCancel,
   onRetry,
 }: HarnessProgressProps) {
-  const trajectoryAnalysis = analyzeTrajectory(trajectory)
+  // The trajectory array only changes when a pass completes, but this
+  // component re-renders for every streamed progress event; derive the
+  // scan and the formatted string once per trajectory instead
+  const trajectoryAnalysis = useMemo(() => analyzeTrajectory(trajectory), [trajectory])
+  const trajectoryDisplay = useMemo(() => formatTrajectory(trajectory), [trajectory])
   const confidencePercent = Math.round(confidence * 100)
 
   // Status-specific styling
@@ -377,7 +382,7 @@ export function HarnessProgress({
                   marginBottom: 'var(--space-2)',
                 }}
               >
-                {formatTrajectory(trajectory)}
+                {trajectoryDisplay}
               </div>
               {trajectoryAnalysis.isNonMonotonic && (
                 <div
@@ -523,7 +528,7 @@ export function HarnessProgress({
                 marginBottom: 'var(--space-2)',
               }}
             >
-              {formatTrajectory(result.trajectoryAnalysis ? trajectory : [])}
+              {result.trajectoryAnalysis ? trajectoryDisplay : '--'}
             </div>
             {result.trajectoryAnalysis && (
               <div style={{ display: 'flex', flexWrap: 'wrap', gap: 'var(--space-2)' }}>
@@ -6,6 +6,10 @@
 const ANTHROPIC_API_URL = 'https://api.anthropic.com/v1/messages'
 const DEFAULT_MODEL = 'claude-sonnet-4-20250514'
 
+// Haiku tier for mechanical calls (validation pings, distillation) - around
+// a tenth of the input cost and 2-3x the throughput of the default model
+export const FAST_MODEL = 'claude-3-5-haiku-20241022'
+
 export interface ClaudeError {
   type: 'rate_limit' | 'invalid_key' | 'network' | 'api_error'
   message: string
@@ -24,6 +28,144 @@ function assertApiKey(): string {
   return key
 }
 
+// Headers are identical for every call with the same key; build them once
+// and let the browser reuse the pooled keep-alive connection across passes
+let cachedHeaders: Record<string, string> | null = null
+let cachedHeadersKey: string | null = null
+
+function buildHeaders(apiKey: string): Record<string, string> {
+  if (!cachedHeaders || cachedHeadersKey !== apiKey) {
+    cachedHeaders = {
+      'Content-Type': 'application/json',
+      'x-api-key': apiKey,
+      'anthropic-version': '2023-06-01',
+      'anthropic-dangerous-direct-browser-access': 'true',
+    }
+    cachedHeadersKey = apiKey
+  }
+  return cachedHeaders
+}
+
+/**
+ * Wrap a system prompt as content blocks marked for Anthropic prompt
+ * caching. System prompts here are stable across the passes of a run (and
+ * across runs), so the cached prefix is served at a fraction of the input
+ * token cost with much lower time-to-first-token.
+ *
+ * An optional context block carries per-run material (scratchpad render,
+ * claim digest) behind its own cache breakpoint: it changes less often
+ * than the per-pass task text, so calls that repeat it still get prefix
+ * hits past the static prompt AND the context.
+ */
+function buildSystemBlocks(
+  systemPrompt: string,
+  systemContext?: string
+): Array<Record<string, unknown>> {
+  const blocks: Array<Record<string, unknown>> = [
+    {
+      type: 'text',
+      text: systemPrompt,
+      cache_control: { type: 'ephemeral' },
+    },
+  ]
+  if (systemContext) {
+    blocks.push({
+      type: 'text',
+      text: systemContext,
+      cache_control: { type: 'ephemeral' },
+    })
+  }
+  return blocks
+}
+
+// Retry and concurrency policy shared by every call. A transient 429/5xx
+// used to abort an entire multi-pass run after several successful (paid)
+// calls; bounded backoff recovers instead. The gate keeps concurrent
+// requests (draft prefetch, chat, passes) from bursting past rate limits.
+const MAX_RETRY_ATTEMPTS = 4
+const RETRY_BASE_DELAY_MS = 500
+const MAX_RETRY_DELAY_MS = 30_000
+const MAX_CONCURRENT_REQUESTS = 4
+
+let activeRequests = 0
+const requestQueue: Array<() => void> = []
+
+async function acquireRequestSlot(): Promise<void> {
+  if (activeRequests < MAX_CONCURRENT_REQUESTS) {
+    activeRequests++
+    return
+  }
+  // A woken waiter inherits the releaser's slot (activeRequests stays put),
+  // so the count never transiently dips below the limit while a handoff is
+  // in flight — an acquire racing in that window could otherwise take the
+  // fast path and push concurrency past the gate
+  await new Promise<void>((resolve) => requestQueue.push(resolve))
+}
+
+function releaseRequestSlot(): void {
+  const next = requestQueue.shift()
+  if (next) {
+    next()
+  } else {
+    activeRequests--
+  }
+}
+
+function sleep(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms))
+}
+
+/**
+ * Single POST path shared by all completion variants
+ */
+async function postMessages(apiKey: string, body: Record<string, unknown>): Promise<Response> {
+  const payload = JSON.stringify(body)
+
+  await acquireRequestSlot()
+  try {
+    for (let attempt = 0; ; attempt++) {
+      let response: Response
+      try {
+        response = await fetch(ANTHROPIC_API_URL, {
+          method: 'POST',
+          headers: buildHeaders(apiKey),
+          body: payload,
+        })
+      } catch (err) {
+        // A dropped connection is as transient as a 529; give it the same
+        // backoff instead of aborting a run that already has paid passes
+        // behind it
+        if (attempt < MAX_RETRY_ATTEMPTS - 1) {
+          await sleep(
+            Math.min(RETRY_BASE_DELAY_MS * 2 ** attempt, MAX_RETRY_DELAY_MS) * (0.5 + Math.random())
+          )
+          continue
+        }
+        const message = err instanceof Error ? err.message : String(err)
+        throw { type: 'network', message: `Network error: ${message}` } as ClaudeError
+      }
+
+      const retryable = response.status === 429 || response.status >= 500
+      if (retryable && attempt < MAX_RETRY_ATTEMPTS - 1) {
+        const retryAfterMs =
+          parseInt(response.headers.get('retry-after') || '0', 10) * 1000
+        // Jitter the exponential delay so concurrent calls rate-limited
+        // together don't all retry at the same instant; a server-provided
+        // retry-after overrides it
+        const delay = retryAfterMs > 0
+          ? Math.min(retryAfterMs, MAX_RETRY_DELAY_MS)
+          : Math.min(RETRY_BASE_DELAY_MS * 2 ** attempt, MAX_RETRY_DELAY_MS) * (0.5 + Math.random())
+        await sleep(delay)
+        continue
+      }
+
+      return await handleResponse(response)
+    }
+  } finally {
+    releaseRequestSlot()
+  }
+}
+
 async function handleResponse(response: Response): Promise<Response> {
   if (response.ok) return response
 
@@ -40,37 +182,77 @@ async function handleResponse(response: Response): Promise<Response> {
   throw { type: 'api_error', message: body.error?.message || `API error: ${response.status}` } as ClaudeError
 }
 
+// Memo for completions whose callers opt in: identical (model, system,
+// user) inputs reuse the previous output instead of paying for another
+// round trip. Bounded FIFO so repeated sessions can't grow it unbounded.
+const MEMO_LIMIT = 32
+const completionMemo = new Map<string, string>()
+
+function rememberCompletion(key: string, output: string): void {
+  if (completionMemo.size >= MEMO_LIMIT) {
+    const oldest = completionMemo.keys().next().value
+    if (oldest !== undefined) completionMemo.delete(oldest)
+  }
+  completionMemo.set(key, output)
+}
+
+// Concurrent identical memoized calls collapse onto a single in-flight
+// request: followers await the leader's promise instead of issuing a
+// duplicate network call (the draft prefetch racing the manual command is
+// the common case). Entries clear on settle either way, so a failed leader
+// doesn't poison later attempts.
+const inflightCompletions = new Map<string, Promise<string>>()
+
+function dedupeInflight(key: string, issue: () => Promise<string>): Promise<string> {
+  const existing = inflightCompletions.get(key)
+  if (existing !== undefined) return existing
+
+  const request = issue()
+  inflightCompletions.set(key, request)
+  const settle = (): void => { inflightCompletions.delete(key) }
+  request.then(settle, settle)
+  return request
+}
+
 /**
  * Make a completion request to Claude API
+ *
+ * Pass `memoize: true` for deterministic-enough calls where identical
+ * inputs should reuse the prior output rather than re-billing a call.
  */
 export async function makeCompletion(
   systemPrompt: string,
   userPrompt: string,
-  options?: { model?: string; maxTokens?: number }
+  options?: { model?: string; maxTokens?: number; memoize?: boolean }
 ): Promise<string> {
   const apiKey = assertApiKey()
+  const model = options?.model || DEFAULT_MODEL
 
-  const response = await fetch(ANTHROPIC_API_URL, {
-    method: 'POST',
-    headers: {
-      'Content-Type': 'application/json',
-      'x-api-key': apiKey,
-      'anthropic-version': '2023-06-01',
-      'anthropic-dangerous-direct-browser-access': 'true',
-    },
-    body: JSON.stringify({
-      model: options?.model || DEFAULT_MODEL,
+  const memoKey = options?.memoize ? `${model}\u0000${systemPrompt}\u0000${userPrompt}` : null
+  if (memoKey) {
+    const cached = completionMemo.get(memoKey)
+    if (cached !== undefined) return cached
+  }
+
+  const issue = async (): Promise<string> => {
+    const response = await postMessages(apiKey, {
+      model,
       max_tokens: options?.maxTokens || 4096,
-      system: systemPrompt,
+      system: buildSystemBlocks(systemPrompt),
       messages: [{ role: 'user', content: userPrompt }],
-    }),
-  }).catch((err) => {
-    throw { type: 'network', message: `Network error: ${err.message}` } as ClaudeError
-  })
+    })
+
+    const data = await response.json()
+    const output = data.content[0]?.text || ''
+
+    if (memoKey && output) {
+      rememberCompletion(memoKey, output)
+    }
+
+    return output
+  }
 
-  await handleResponse(response)
-  const data = await response.json()
-  return data.content[0]?.text || ''
+  return memoKey ? dedupeInflight(memoKey, issue) : issue()
 }
 
 /**
@@ -81,31 +263,18 @@ export async function makeStreamingCompletion(
   systemPrompt: string,
   userPrompt: string,
   onChunk: (text: string) => void,
-  options?: { model?: string; maxTokens?: number }
+  options?: { model?: string; maxTokens?: number; systemContext?: string }
 ): Promise<string> {
   const apiKey = assertApiKey()
 
-  const response = await fetch(ANTHROPIC_API_URL, {
-    method: 'POST',
-    headers: {
-      'Content-Type': 'application/json',
-      'x-api-key': apiKey,
-      'anthropic-version': '2023-06-01',
-      'anthropic-dangerous-direct-browser-access': 'true',
-    },
-    body: JSON.stringify({
-      model: options?.model || DEFAULT_MODEL,
-      max_tokens: options?.maxTokens || 4096,
-      stream: true,
-      system: systemPrompt,
-      messages: [{ role: 'user', content: userPrompt }],
-    }),
-  }).catch((err) => {
-    throw { type: 'network', message: `Network error: ${err.message}` } as ClaudeError
+  const response = await postMessages(apiKey, {
+    model: options?.model || DEFAULT_MODEL,
+    max_tokens: options?.maxTokens || 4096,
+    stream: true,
+    system: buildSystemBlocks(systemPrompt, options?.systemContext),
+    messages: [{ role: 'user', content: userPrompt }],
   })
 
-  await handleResponse(response)
-
   const reader = response.body?.getReader()
   if (!reader) throw { type: 'api_error', message: 'No response body' } as ClaudeError
 
@@ -118,14 +287,23 @@ export async function makeStreamingCompletion(
     if (done) break
 
     buffer += decoder.decode(value, { stream: true })
-    const lines = buffer.split('\n')
-    buffer = lines.pop() || ''
 
-    for (const line of lines) {
+    // Scan complete lines in place rather than split()-ing the whole
+    // buffer into an array on every network read
+    let start = 0
+    let newline: number
+    while ((newline = buffer.indexOf('\n', start)) !== -1) {
+      const line = buffer.slice(start, newline)
+      start = newline + 1
+
       if (!line.startsWith('data: ')) continue
       const data = line.slice(6)
       if (data === '[DONE]') continue
 
+      // Only delta frames carry text; a cheap substring check skips the
+      // JSON.parse for pings, block boundaries and usage bookkeeping
+      if (!data.includes('content_block_delta')) continue
+
       try {
         const event = JSON.parse(data)
         if (event.type === 'content_block_delta' && event.delta?.text) {
@@ -136,6 +314,7 @@ export async function makeStreamingCompletion(
         // Skip malformed JSON
       }
     }
+    buffer = start > 0 ? buffer.slice(start) : buffer
   }
 
   return fullText
@@ -155,14 +334,11 @@ export async function validateApiKey(key: string): Promise<boolean> {
   try {
     const response = await fetch(ANTHROPIC_API_URL, {
       method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'x-api-key': key,
-        'anthropic-version': '2023-06-01',
-        'anthropic-dangerous-direct-browser-access': 'true',
-      },
+      headers: buildHeaders(key),
       body: JSON.stringify({
-        model: DEFAULT_MODEL,
+        // Key validation only needs any successful round trip - use the
+        // cheapest model rather than spending a sonnet call on a ping
+        model: FAST_MODEL,
         max_tokens: 1,
         messages: [{ role: 'user', content: 'hi' }],
       }),
@@ -178,11 +354,69 @@ export interface Tool {
   description: string
   input_schema: {
     type: 'object'
-    properties: Record<string, { type: string; description?: string }>
+    // Nested schemas (items, enum, ...) are allowed beyond the common
+    // type/description pair
+    properties: Record<string, { type: string; description?: string; [key: string]: unknown }>
     required: string[]
   }
 }
 
+/**
+ * Make a completion that must return structured data.
+ *
+ * Forces a single tool call whose input matches the given schema, so the
+ * model emits the fields directly instead of prose-wrapped JSON that has
+ * to be scraped back out (and occasionally fails to parse). Spends no
+ * output tokens on markdown scaffolding.
+ */
+export async function makeStructuredCompletion<T>(
+  systemPrompt: string,
+  userPrompt: string,
+  tool: Tool,
+  options?: { model?: string; maxTokens?: number; memoize?: boolean }
+): Promise<T> {
+  const apiKey = assertApiKey()
+  const model = options?.model || DEFAULT_MODEL
+
+  const memoKey = options?.memoize
+    ? `${model}\u0000${tool.name}\u0000${systemPrompt}\u0000${userPrompt}`
+    : null
+  if (memoKey) {
+    const cached = completionMemo.get(memoKey)
+    if (cached !== undefined) {
+      return JSON.parse(cached) as T
+    }
+  }
+
+  const issue = async (): Promise<string> => {
+    const response = await postMessages(apiKey, {
+      model,
+      max_tokens: options?.maxTokens || 4096,
+      system: buildSystemBlocks(systemPrompt),
+      messages: [{ role: 'user', content: userPrompt }],
+      tools: [tool],
+      tool_choice: { type: 'tool', name: tool.name },
+    })
+
+    const data = await response.json()
+    const block = Array.isArray(data.content)
+      ? data.content.find((b: { type?: string }) => b.type === 'tool_use')
+      : undefined
+    if (!block || block.input === undefined) {
+      throw { type: 'api_error', message: 'Expected a tool_use block in the response' } as ClaudeError
+    }
+
+    const serialized = JSON.stringify(block.input)
+    if (memoKey) {
+      rememberCompletion(memoKey, serialized)
+    }
+    return serialized
+  }
+
+  const serialized = memoKey ? await dedupeInflight(memoKey, issue) : await issue()
+  return JSON.parse(serialized) as T
+}
+
 interface Message {
   role: 'user' | 'assistant'
   content: string | ContentBlock[]
@@ -198,6 +432,21 @@ interface ContentBlock {
   content?: string
 }
 
+/**
+ * Mark the last tool definition as a cache breakpoint. Tool schemas sit
+ * before the system prompt in the cached prefix, so this lets the whole
+ * tools-plus-system block be served from the prompt cache on the second
+ * and later iterations of a tool loop.
+ */
+function withToolCacheBreakpoint(tools: Tool[]): Array<Record<string, unknown>> {
+  if (tools.length === 0) return tools
+  return tools.map((tool, i) =>
+    i === tools.length - 1
+      ? { ...tool, cache_control: { type: 'ephemeral' } }
+      : tool
+  )
+}
+
 /**
  * Make a streaming completion request with tool support
  * Handles tool_use blocks by calling onToolCall, then continues the conversation
@@ -215,29 +464,21 @@ export async function makeCompletionWithTools(
   let fullResponse = ''
   const maxIterations = 10 // Prevent infinite loops
 
+  // Tools and system prompt are identical across loop iterations, so the
+  // prefix built here is a cache hit from the second iteration on
+  const cachedTools = withToolCacheBreakpoint(tools)
+  const systemBlocks = buildSystemBlocks(systemPrompt)
+
   for (let iteration = 0; iteration < maxIterations; iteration++) {
-    const response = await fetch(ANTHROPIC_API_URL, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'x-api-key': apiKey,
-        'anthropic-version': '2023-06-01',
-        'anthropic-dangerous-direct-browser-access': 'true',
-      },
-      body: JSON.stringify({
-        model: options?.model || DEFAULT_MODEL,
-        max_tokens: options?.maxTokens || 4096,
-        stream: true,
-        system: systemPrompt,
-        messages,
-        tools,
-      }),
-    }).catch((err) => {
-      throw { type: 'network', message: `Network error: ${err.message}` } as ClaudeError
+    const response = await postMessages(apiKey, {
+      model: options?.model || DEFAULT_MODEL,
+      max_tokens: options?.maxTokens || 4096,
+      stream: true,
+      system: systemBlocks,
+      messages,
+      tools: cachedTools,
     })
 
-    await handleResponse(response)
-
     const reader = response.body?.getReader()
     if (!reader) throw { type: 'api_error', message: 'No response body' } as ClaudeError
 
@@ -255,10 +496,14 @@ export async function makeCompletionWithTools(
       if (done) break
 
       buffer += decoder.decode(value, { stream: true })
-      const lines = buffer.split('\n')
-      buffer = lines.pop() || ''
 
-      for (const line of lines) {
+      // Scan complete lines in place (see makeStreamingCompletion)
+      let start = 0
+      let newline: number
+      while ((newline = buffer.indexOf('\n', start)) !== -1) {
+        const line = buffer.slice(start, newline)
+        start = newline + 1
+
         if (!line.startsWith('data: ')) continue
         const data = line.slice(6)
         if (data === '[DONE]') continue
@@ -301,6 +546,7 @@ export async function makeCompletionWithTools(
           // Skip malformed JSON
         }
       }
+      buffer = start > 0 ? buffer.slice(start) : buffer
     }
 
     // If no tool calls, we're done
@@ -323,28 +569,32 @@ export async function makeCompletionWithTools(
     }
     messages.push({ role: 'assistant', content: assistantContent })
 
-    // Execute tools and build tool_result blocks
-    const toolResults: ContentBlock[] = []
-    for (const tc of toolCalls) {
-      onChunk(`\n\n[Using tool: ${tc.name}...]\n`)
-      try {
-        const result = await onToolCall(tc.name, tc.input)
-        toolResults.push({
-          type: 'tool_result',
-          tool_use_id: tc.id,
-          content: result,
-        })
-        onChunk(`[Tool result received]\n\n`)
-      } catch (err) {
-        const errMsg = err instanceof Error ? err.message : 'Tool execution failed'
-        toolResults.push({
-          type: 'tool_result',
-          tool_use_id: tc.id,
-          content: `Error: ${errMsg}`,
-        })
-        onChunk(`[Tool error: ${errMsg}]\n\n`)
-      }
-    }
+    // Execute tools concurrently: calls in one assistant turn are
+    // independent of each other, so N serialized round trips collapse to
+    // the slowest one. Promise.all preserves result order to match the
+    // tool_use block order.
+    const toolResults: ContentBlock[] = await Promise.all(
+      toolCalls.map(async (tc): Promise<ContentBlock> => {
+        onChunk(`\n\n[Using tool: ${tc.name}...]\n`)
+        try {
+          const result = await onToolCall(tc.name, tc.input)
+          onChunk(`[Tool result received]\n\n`)
+          return {
+            type: 'tool_result',
+            tool_use_id: tc.id,
+            content: result,
+          }
+        } catch (err) {
+          const errMsg = err instanceof Error ? err.message : 'Tool execution failed'
+          onChunk(`[Tool error: ${errMsg}]\n\n`)
+          return {
+            type: 'tool_result',
+            tool_use_id: tc.id,
+            content: `Error: ${errMsg}`,
+          }
+        }
+      })
+    )
     messages.push({ role: 'user', content: toolResults })
   }
 
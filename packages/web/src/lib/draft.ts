@@ -3,7 +3,7 @@
  * Generates an initial thesis immediately after ingest, before interview
  */
 
-import { makeCompletion } from './claude'
+import { makeCompletion, FAST_MODEL } from './claude'
 import type { Claim } from './ingest'
 
 export interface DraftThesis {
@@ -13,25 +13,7 @@ export interface DraftThesis {
   questionsToExplore: string[]
 }
 
-/**
- * Generate a draft thesis from extracted claims
- * This provides an immediate synthesis that the user can then refine through conversation
- */
-export async function generateDraftThesis(claims: Claim[]): Promise<DraftThesis> {
-  if (claims.length === 0) {
-    return {
-      coreBelief: 'No claims extracted from source.',
-      keyEvidence: [],
-      initialConfidence: 0,
-      questionsToExplore: ['Re-ingest source or try a different URL'],
-    }
-  }
-
-  const claimList = claims
-    .map((c) => `@${c.id} [${c.type}]: ${c.text}\n  Quote: "${c.snippet}"`)
-    .join('\n\n')
-
-  const systemPrompt = `You are a thesis synthesis assistant. Your task is to generate a DRAFT thesis from extracted claims.
+const DRAFT_SYSTEM_PROMPT = `You are a thesis synthesis assistant. Your task is to generate a DRAFT thesis from extracted claims.
 
 ## Your Goal
 Create an initial thesis that captures the core argument of the source material. This is a starting point for dialectic refinement, not a final position.
@@ -78,14 +60,39 @@ Return ONLY valid JSON. No markdown, no explanation.
 - Ask about implications and second-order effects
 - These should guide the conversation, not be rhetorical`
 
+/**
+ * Generate a draft thesis from extracted claims
+ * This provides an immediate synthesis that the user can then refine through conversation
+ */
+export async function generateDraftThesis(claims: Claim[]): Promise<DraftThesis> {
+  if (claims.length === 0) {
+    return {
+      coreBelief: 'No claims extracted from source.',
+      keyEvidence: [],
+      initialConfidence: 0,
+      questionsToExplore: ['Re-ingest source or try a different URL'],
+    }
+  }
+
+  const claimList = claims
+    .map((c) => `@${c.id} [${c.type}]: ${c.text}\n  Quote: "${c.snippet}"`)
+    .join('\n\n')
+
   const userPrompt = `# Extracted Claims
 
 ${claimList}
 
 Generate a draft thesis that captures the author's core argument. Include the strongest evidence and the most important questions to explore.`
 
-  const response = await makeCompletion(systemPrompt, userPrompt, {
+  const response = await makeCompletion(DRAFT_SYSTEM_PROMPT, userPrompt, {
+    // The draft is a disposable starting point the interview immediately
+    // revises; the fast tier is plenty for schema-following summarization
+    // and shortens the ingest-to-draft gap
+    model: FAST_MODEL,
     maxTokens: 1500,
+    // The post-interview flow falls back to a fresh draft call when the
+    // ingest-time prefetch failed; identical claims reuse that result
+    memoize: true,
   })
 
   let draft: DraftThesis
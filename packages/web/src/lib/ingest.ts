@@ -5,7 +5,7 @@
  * Text ingestion: Uses local Claude API call (for clipboard paste)
  */
 
-import { makeCompletion } from './claude'
+import { makeStructuredCompletion, type Tool } from './claude'
 import type { IngestRequest, IngestResponse } from './api'
 
 export interface Claim {
@@ -61,15 +61,7 @@ async function parseErrorResponse(response: Response): Promise<string> {
   }
 }
 
-/**
- * Extract claims from source text using Claude
- * Returns 3-7 claims with exact character offsets for highlighting
- */
-export async function extractClaims(text: string, title: string): Promise<Claim[]> {
-  const systemPrompt = `You are a dialectic analysis assistant. Your task is to extract key claims from source material.
-
-## Output Format
-Return ONLY valid JSON array. No markdown, no explanation.
+const CLAIM_EXTRACTION_SYSTEM_PROMPT = `You are a dialectic analysis assistant. Your task is to extract key claims from source material.
 
 ## Claim Types
 - core_thesis: Central argument or main point
@@ -83,44 +75,65 @@ Return ONLY valid JSON array. No markdown, no explanation.
 3. The quote must appear VERBATIM in the source text
 4. Calculate character offsets for highlighting
 
-## JSON Schema
-[
-  {
-    "id": "CLAIM-1",
-    "text": "Summary of the claim in your words (1-2 sentences)",
-    "type": "core_thesis|framework|meta|counter",
-    "snippet": "Exact verbatim quote from the source",
-    "quote_start": 0,
-    "quote_end": 100
-  }
-]
-
 CRITICAL: The snippet MUST be an exact substring of the source text. The quote_start and quote_end must be correct character positions.`
 
+// Forced tool schema for extraction: the model fills these fields directly
+// instead of emitting JSON as prose, so there is no markdown stripping or
+// parse failure path on the happy path
+const CLAIM_EXTRACTION_TOOL: Tool = {
+  name: 'record_claims',
+  description: 'Record the key claims extracted from the source text',
+  input_schema: {
+    type: 'object',
+    properties: {
+      claims: {
+        type: 'array',
+        items: {
+          type: 'object',
+          properties: {
+            id: { type: 'string', description: 'CLAIM-1, CLAIM-2, ...' },
+            text: { type: 'string', description: 'Summary of the claim in your words (1-2 sentences)' },
+            type: { type: 'string', enum: ['core_thesis', 'framework', 'meta', 'counter'] },
+            snippet: { type: 'string', description: 'Exact verbatim quote from the source' },
+            quote_start: { type: 'number' },
+            quote_end: { type: 'number' },
+          },
+          required: ['text', 'type', 'snippet'],
+        },
+      },
+    },
+    required: ['claims'],
+  },
+}
+
+/**
+ * Extract claims from source text using Claude
+ * Returns 3-7 claims with exact character offsets for highlighting
+ */
+export async function extractClaims(text: string, title: string): Promise<Claim[]> {
   const userPrompt = `# Source: ${title}
 
 <source_text>
 ${text}
 </source_text>
 
-Extract 3-7 key claims with exact quotes and character offsets. Return ONLY the JSON array.`
+Extract 3-7 key claims with exact quotes and character offsets.`
 
-  const response = await makeCompletion(systemPrompt, userPrompt, {
-    maxTokens: 2048,
-  })
+  const result = await makeStructuredCompletion<{ claims: Claim[] }>(
+    CLAIM_EXTRACTION_SYSTEM_PROMPT,
+    userPrompt,
+    CLAIM_EXTRACTION_TOOL,
+    {
+      maxTokens: 2048,
+      // 'extract claims' can be re-run on an unchanged source (and ingest
+      // retried after a downstream failure); identical text reuses the
+      // prior extraction instead of re-billing the call
+      memoize: true,
+    }
+  )
 
-  // Parse JSON response
-  let claims: Claim[]
-  try {
-    // Handle potential markdown code blocks
-    const jsonStr = response.replace(/```json?\s*|\s*```/g, '').trim()
-    console.log('[ingest] Parsing claims JSON, length:', jsonStr.length)
-    claims = JSON.parse(jsonStr)
-    console.log('[ingest] Parsed', claims.length, 'claims')
-  } catch (e) {
-    console.error('[ingest] Failed to parse claims JSON. Response was:', response.substring(0, 500))
-    throw new Error(`Failed to parse claim extraction response. Claude may have returned invalid JSON.`)
-  }
+  let claims = result.claims
+  console.log('[ingest] Extracted', Array.isArray(claims) ? claims.length : 0, 'claims')
 
   // Handle empty array
   if (!Array.isArray(claims) || claims.length === 0) {
@@ -160,7 +173,28 @@ Extract 3-7 key claims with exact quotes and character offsets. Return ONLY the
     return { ...claim, id }
   })
 
-  return claims
+  return dedupeClaims(claims)
+}
+
+/**
+ * Drop claims whose normalized text duplicates an earlier one
+ *
+ * Extraction occasionally restates the same point under two ids; every
+ * duplicate inflates the input tokens of each downstream prompt that
+ * embeds the claim list, so cut them once at the source.
+ */
+function dedupeClaims(claims: Claim[]): Claim[] {
+  const seen = new Set<string>()
+  const unique = claims.filter((claim) => {
+    const key = claim.text.toLowerCase().replace(/\s+/g, ' ').trim()
+    if (seen.has(key)) return false
+    seen.add(key)
+    return true
+  })
+  if (unique.length < claims.length) {
+    console.log('[ingest] Dropped', claims.length - unique.length, 'duplicate claims')
+  }
+  return unique
 }
 
 /**
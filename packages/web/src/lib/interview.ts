@@ -12,8 +12,10 @@ import {
   createScratchpad,
   setStage,
   addClaims,
+  updateEssay,
   type Scratchpad,
 } from './scratchpad'
+import { loadScratchpadSnapshot } from './storage'
 import type { Claim } from './ingest'
 
 export interface QuestionOption {
@@ -36,20 +38,7 @@ export interface Position {
   elaboration?: string
 }
 
-/**
- * Generate probing questions from extracted claims
- * Creates 2-4 questions per source, each referencing a specific claim
- */
-export async function generateQuestions(claims: Claim[]): Promise<Question[]> {
-  if (claims.length === 0) {
-    return []
-  }
-
-  const claimList = claims
-    .map((c) => `@${c.id} [${c.type}]: ${c.text}\n  Quote: "${c.snippet}"`)
-    .join('\n\n')
-
-  const systemPrompt = `You are a dialectic challenger. Your task is to generate PROVOCATIVE questions that force the user to take uncomfortable positions and confront the weakest points of the source's argument.
+const QUESTION_SYSTEM_PROMPT = `You are a dialectic challenger. Your task is to generate PROVOCATIVE questions that force the user to take uncomfortable positions and confront the weakest points of the source's argument.
 
 ## Output Format
 Return ONLY valid JSON array. No markdown, no explanation.
@@ -99,13 +88,26 @@ CRITICAL:
 - "Other" is implicit - don't include it
 - Generate 2-4 questions targeting the most contentious or assumption-heavy claims`
 
+/**
+ * Generate probing questions from extracted claims
+ * Creates 2-4 questions per source, each referencing a specific claim
+ */
+export async function generateQuestions(claims: Claim[]): Promise<Question[]> {
+  if (claims.length === 0) {
+    return []
+  }
+
+  const claimList = claims
+    .map((c) => `@${c.id} [${c.type}]: ${c.text}\n  Quote: "${c.snippet}"`)
+    .join('\n\n')
+
   const userPrompt = `# Extracted Claims
 
 ${claimList}
 
 Generate 2-4 CHALLENGING questions that will expose where the user really stands. Target the claims that seem most confident, most assumption-heavy, or most likely to create cognitive dissonance. Make the user uncomfortable - that's where real thinking happens.`
 
-  const response = await makeCompletion(systemPrompt, userPrompt, {
+  const response = await makeCompletion(QUESTION_SYSTEM_PROMPT, userPrompt, {
     maxTokens: 2048,
   })
 
@@ -261,6 +263,10 @@ function getShapeSkill(): Skill {
   return cachedShapeSkill
 }
 
+// Output-parsing patterns, compiled once at module load
+const QUESTIONS_SECTION_REGEX = /## Interview Questions[\s\S]*?```json\s*([\s\S]*?)```/i
+const ESSAY_SECTION_REGEX = /## Essay\s*([\s\S]*?)(?=##|$)/i
+
 /**
  * Execute SHAPE skill to generate questions AND draft essay
  * Uses multi-pass execution with scratchpad accumulation
@@ -271,10 +277,18 @@ export async function executeShapeSkill(
   claims: Claim[],
   callbacks?: ExecutionCallbacks
 ): Promise<ShapeResult> {
-  // Create scratchpad with claims
-  let scratchpad = createScratchpad(sessionId, sessionTitle)
-  scratchpad = setStage(scratchpad, 'shape')
-  scratchpad = addClaims(scratchpad, claims.map(c => `@${c.id} [${c.type}]: ${c.text}`))
+  // A failed run leaves a per-pass snapshot behind (see skillExecutor).
+  // Resume from it on retry so the markers already paid for carry over
+  // instead of starting from an empty scratchpad.
+  const snapshot = loadScratchpadSnapshot(sessionId)
+  let scratchpad: Scratchpad
+  if (snapshot && snapshot.currentStage === 'shape') {
+    scratchpad = snapshot
+  } else {
+    scratchpad = createScratchpad(sessionId, sessionTitle)
+    scratchpad = setStage(scratchpad, 'shape')
+    scratchpad = addClaims(scratchpad, claims.map(c => `@${c.id} [${c.type}]: ${c.text}`))
+  }
 
   const skill = getShapeSkill()
 
@@ -293,7 +307,7 @@ export async function executeShapeSkill(
   }
 
   // Parse questions from output
-  const questionsMatch = result.finalOutput.match(/## Interview Questions[\s\S]*?```json\s*([\s\S]*?)```/i)
+  const questionsMatch = result.finalOutput.match(QUESTIONS_SECTION_REGEX)
   let questions: Question[] = []
 
   if (questionsMatch) {
@@ -313,13 +327,12 @@ export async function executeShapeSkill(
   questions = questions.filter(q => claimIds.has(q.claim_ref))
 
   // Extract essay from output
-  const essayMatch = result.finalOutput.match(/## Essay\s*([\s\S]*?)(?=##|$)/i)
+  const essayMatch = result.finalOutput.match(ESSAY_SECTION_REGEX)
   const draftEssay = essayMatch ? essayMatch[1].trim() : ''
 
   // Update scratchpad with essay
   if (draftEssay) {
-    result.updatedScratchpad.essay = draftEssay
-    result.updatedScratchpad.lastUpdated = Date.now()
+    result.updatedScratchpad = updateEssay(result.updatedScratchpad, draftEssay)
   }
 
   return {
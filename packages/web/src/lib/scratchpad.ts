@@ -55,7 +55,7 @@ export const SEMANTIC_MARKERS = {
   META: /\[META\]([^[]*?)(?=\[|$)/gi,
 } as const
 
-type MarkerType = keyof typeof SEMANTIC_MARKERS
+export type MarkerType = keyof typeof SEMANTIC_MARKERS
 
 const MARKER_TO_SECTION: Record<MarkerType, ScratchpadSection['type']> = {
   INSIGHT: 'insights',
@@ -68,31 +68,64 @@ const MARKER_TO_SECTION: Record<MarkerType, ScratchpadSection['type']> = {
   META: 'meta',
 }
 
+// All marker tags as one alternation, for the single-pass scanner below
+const MARKER_TAG_REGEX = /\[(INSIGHT|EVIDENCE|RISK|COUNTER|PATTERN|QUESTION|DECISION|META)\]/gi
+
+/**
+ * Scan text once for every semantic marker occurrence.
+ *
+ * Running each SEMANTIC_MARKERS pattern separately walks the full text
+ * eight times. One alternation pass finds every tag; each body runs from
+ * the tag to the next '[' (or end of text), which is exactly what the
+ * per-marker patterns match. Empty bodies are dropped here.
+ */
+export function scanMarkers(text: string): Map<MarkerType, string[]> {
+  const found = new Map<MarkerType, string[]>()
+
+  for (const match of text.matchAll(MARKER_TAG_REGEX)) {
+    const type = match[1].toUpperCase() as MarkerType
+    const bodyStart = match.index! + match[0].length
+    const nextBracket = text.indexOf('[', bodyStart)
+    const content = (nextBracket === -1 ? text.slice(bodyStart) : text.slice(bodyStart, nextBracket)).trim()
+    if (!content) continue
+
+    const existing = found.get(type)
+    if (existing) {
+      existing.push(content)
+    } else {
+      found.set(type, [content])
+    }
+  }
+
+  return found
+}
+
 /**
  * Create a new scratchpad
  */
 export function createScratchpad(sessionId: string, title: string): Scratchpad {
+  const now = Date.now()
   return {
     sessionId,
     title,
     sections: [
-      { id: 'claims', type: 'claims', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'insights', type: 'insights', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'evidence', type: 'evidence', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'risks', type: 'risks', content: [], lastUpdated: Date.now(), preserved: false },
-      { id: 'counters', type: 'counters', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'questions', type: 'questions', content: [], lastUpdated: Date.now(), preserved: false },
-      { id: 'patterns', type: 'patterns', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'decisions', type: 'decisions', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'tensions', type: 'tensions', content: [], lastUpdated: Date.now(), preserved: true },
-      { id: 'meta', type: 'meta', content: [], lastUpdated: Date.now(), preserved: false },
+      { id: 'claims', type: 'claims', content: [], lastUpdated: now, preserved: true },
+      { id: 'insights', type: 'insights', content: [], lastUpdated: now, preserved: true },
+      { id: 'evidence', type: 'evidence', content: [], lastUpdated: now, preserved: true },
+      { id: 'risks', type: 'risks', content: [], lastUpdated: now, preserved: false },
+      { id: 'counters', type: 'counters', content: [], lastUpdated: now, preserved: true },
+      { id: 'questions', type: 'questions', content: [], lastUpdated: now, preserved: false },
+      { id: 'patterns', type: 'patterns', content: [], lastUpdated: now, preserved: true },
+      { id: 'decisions', type: 'decisions', content: [], lastUpdated: now, preserved: true },
+      { id: 'tensions', type: 'tensions', content: [], lastUpdated: now, preserved: true },
+      { id: 'meta', type: 'meta', content: [], lastUpdated: now, preserved: false },
     ],
     confidenceHistory: [],
     currentConfidence: 0.5,
     cycleCount: 0,
     tokenEstimate: 0,
-    created: Date.now(),
-    lastUpdated: Date.now(),
+    created: now,
+    lastUpdated: now,
     currentStage: 'gather',
     essay: '',
     userQuotes: [],
@@ -103,27 +136,66 @@ export function createScratchpad(sessionId: string, title: string): Scratchpad {
  * Extract marked content from expansion output and merge into scratchpad
  */
 export function extractAndMerge(scratchpad: Scratchpad, expansionText: string): Scratchpad {
+  // One scan of the expansion output finds all marker types at once
+  return mergeMarkerGroups(scratchpad, scanMarkers(expansionText))
+}
+
+/**
+ * Merge markers that were already extracted elsewhere - e.g. incrementally
+ * while a response streamed in - without re-scanning the output text.
+ * Content is expected trimmed and non-empty, as the scanners produce it.
+ */
+export function mergeExtractedMarkers(
+  scratchpad: Scratchpad,
+  markers: Array<{ type: MarkerType; content: string }>
+): Scratchpad {
+  const grouped = new Map<MarkerType, string[]>()
+  for (const marker of markers) {
+    const existing = grouped.get(marker.type)
+    if (existing) {
+      existing.push(marker.content)
+    } else {
+      grouped.set(marker.type, [marker.content])
+    }
+  }
+  return mergeMarkerGroups(scratchpad, grouped)
+}
+
+function mergeMarkerGroups(scratchpad: Scratchpad, extracted: Map<MarkerType, string[]>): Scratchpad {
   const updated = { ...scratchpad, sections: [...scratchpad.sections] }
   const now = Date.now()
+  let changed = false
 
-  // Extract content for each marker type
-  for (const [marker, regex] of Object.entries(SEMANTIC_MARKERS)) {
-    const sectionType = MARKER_TO_SECTION[marker as MarkerType]
+  for (const [marker, contents] of extracted) {
+    const sectionType = MARKER_TO_SECTION[marker]
     const sectionIndex = updated.sections.findIndex(s => s.type === sectionType)
     if (sectionIndex === -1) continue
 
-    const section = { ...updated.sections[sectionIndex] }
-    const matches = expansionText.matchAll(new RegExp(regex))
+    const section = updated.sections[sectionIndex]
 
-    for (const match of matches) {
-      const content = match[1].trim()
-      if (content && !section.content.includes(content)) {
-        section.content = [...section.content, content]
-        section.lastUpdated = now
+    // Collect additions first, then copy the content array once - the old
+    // per-match spread rebuilt the whole array for every new item
+    let additions: string[] | null = null
+    for (const content of contents) {
+      if (!section.content.includes(content) && !additions?.includes(content)) {
+        (additions ??= []).push(content)
       }
     }
 
-    updated.sections[sectionIndex] = section
+    if (additions) {
+      updated.sections[sectionIndex] = {
+        ...section,
+        content: section.content.concat(additions),
+        lastUpdated: now,
+      }
+      changed = true
+    }
+  }
+
+  // No new markers: return the original object so callers can detect the
+  // empty delta by identity and skip downstream work (re-render, re-critique)
+  if (!changed) {
+    return scratchpad
   }
 
   // Update token estimate
@@ -227,9 +299,11 @@ export function renderScratchpad(scratchpad: Scratchpad): string {
 
   // Confidence trajectory (from EXP-004 - non-monotonic reveals genuine exploration)
   if (scratchpad.confidenceHistory.length > 0) {
-    const trajectory = [...scratchpad.confidenceHistory, scratchpad.currentConfidence]
+    // Append the current value directly rather than copying the history
+    // into a throwaway combined array
+    const trajectory = scratchpad.confidenceHistory
       .map(c => (c * 100).toFixed(0) + '%')
-      .join(' → ')
+      .join(' → ') + ' → ' + (scratchpad.currentConfidence * 100).toFixed(0) + '%'
     sections.push(`Trajectory: ${trajectory}`)
   }
 
@@ -262,13 +336,15 @@ export function checkTermination(scratchpad: Scratchpad, maxCycles: number = 5):
     return null
   }
 
-  const history = [...scratchpad.confidenceHistory, scratchpad.currentConfidence]
+  // The trajectory is history plus the current value; only its last three
+  // entries matter here, so read them in place instead of building the
+  // combined array
+  const history = scratchpad.confidenceHistory
 
   // Saturation: delta_confidence < 0.05 for 2 cycles
-  if (history.length >= 3) {
-    const recent = history.slice(-3)
-    const delta1 = Math.abs(recent[1] - recent[0])
-    const delta2 = Math.abs(recent[2] - recent[1])
+  if (history.length >= 2) {
+    const delta1 = Math.abs(history[history.length - 1] - history[history.length - 2])
+    const delta2 = Math.abs(scratchpad.currentConfidence - history[history.length - 1])
     if (delta1 < 0.05 && delta2 < 0.05) {
       return 'confidence_saturated'
     }
@@ -296,27 +372,34 @@ export function analyzeTrajectory(scratchpad: Scratchpad): {
   maxDip: number
   finalTrend: 'increasing' | 'decreasing' | 'stable'
 } {
-  const history = [...scratchpad.confidenceHistory, scratchpad.currentConfidence]
-  if (history.length < 2) {
+  // Trajectory = history entries followed by the current value; index
+  // through both in place rather than concatenating them into a new array
+  const history = scratchpad.confidenceHistory
+  const total = history.length + 1
+  if (total < 2) {
     return { isMonotonic: true, maxDip: 0, finalTrend: 'stable' }
   }
 
+  const at = (i: number): number =>
+    i < history.length ? history[i] : scratchpad.currentConfidence
+
   let isMonotonic = true
   let maxDip = 0
-  let maxSoFar = history[0]
+  let maxSoFar = at(0)
 
-  for (let i = 1; i < history.length; i++) {
-    if (history[i] < history[i - 1]) {
+  for (let i = 1; i < total; i++) {
+    const value = at(i)
+    if (value < at(i - 1)) {
       isMonotonic = false
-      const dip = maxSoFar - history[i]
+      const dip = maxSoFar - value
       if (dip > maxDip) maxDip = dip
     }
-    maxSoFar = Math.max(maxSoFar, history[i])
+    maxSoFar = Math.max(maxSoFar, value)
   }
 
   // Final trend from last 2 points
-  const last = history[history.length - 1]
-  const prev = history[history.length - 2]
+  const last = at(total - 1)
+  const prev = at(total - 2)
   const finalTrend = last > prev + 0.03 ? 'increasing'
     : last < prev - 0.03 ? 'decreasing'
     : 'stable'
@@ -368,14 +451,15 @@ export function addClaims(scratchpad: Scratchpad, claims: string[]): Scratchpad
   const claimsSection = scratchpad.sections.find(s => s.type === 'claims')
   if (!claimsSection) return scratchpad
 
+  const now = Date.now()
   const updated = { ...scratchpad, sections: [...scratchpad.sections] }
   const sectionIndex = updated.sections.findIndex(s => s.type === 'claims')
   updated.sections[sectionIndex] = {
     ...claimsSection,
     content: [...claimsSection.content, ...claims],
-    lastUpdated: Date.now(),
+    lastUpdated: now,
   }
-  updated.lastUpdated = Date.now()
+  updated.lastUpdated = now
   return updated
 }
 
@@ -386,14 +470,15 @@ export function addTension(scratchpad: Scratchpad, tension: string): Scratchpad
   const tensionsSection = scratchpad.sections.find(s => s.type === 'tensions')
   if (!tensionsSection) return scratchpad
 
+  const now = Date.now()
   const updated = { ...scratchpad, sections: [...scratchpad.sections] }
   const sectionIndex = updated.sections.findIndex(s => s.type === 'tensions')
   updated.sections[sectionIndex] = {
     ...tensionsSection,
     content: [...tensionsSection.content, tension],
-    lastUpdated: Date.now(),
+    lastUpdated: now,
   }
-  updated.lastUpdated = Date.now()
+  updated.lastUpdated = now
   return updated
 }
 
@@ -410,10 +495,17 @@ export function formatUserQuotesForPrompt(scratchpad: Scratchpad): string {
   return lines.join('\n')
 }
 
-/**
- * Render scratchpad with essay for skill prompts
- */
-export function renderForSkillPrompt(scratchpad: Scratchpad): string {
+// Budget for scratchpad context embedded in each pass prompt. Every later
+// pass re-reads this context as input tokens, so an unbounded render makes
+// each cycle slower and more expensive than the last.
+const MAX_PROMPT_CONTEXT_TOKENS = 4000
+
+interface RenderLimits {
+  listItems: number
+  essayChars: number
+}
+
+function buildSkillPromptSections(scratchpad: Scratchpad, limits: RenderLimits): string {
   const sections: string[] = []
 
   sections.push(`# Session Context`)
@@ -445,21 +537,72 @@ export function renderForSkillPrompt(scratchpad: Scratchpad): string {
   // Current essay draft
   if (scratchpad.essay) {
     sections.push('\n## Current Essay Draft')
-    sections.push(scratchpad.essay)
+    sections.push(scratchpad.essay.length > limits.essayChars
+      ? scratchpad.essay.slice(0, limits.essayChars) + '\n[... essay truncated for context budget ...]'
+      : scratchpad.essay
+    )
   }
 
-  // Other accumulated content
+  // Other accumulated content - most recent items carry the latest thinking
   const insights = scratchpad.sections.find(s => s.type === 'insights')
   if (insights && insights.content.length > 0) {
     sections.push('\n## Key Insights')
-    insights.content.forEach(i => sections.push(`- ${i}`))
+    insights.content.slice(-limits.listItems).forEach(i => sections.push(`- ${i}`))
   }
 
   const counters = scratchpad.sections.find(s => s.type === 'counters')
   if (counters && counters.content.length > 0) {
     sections.push('\n## Counterarguments')
-    counters.content.forEach(c => sections.push(`- ${c}`))
+    counters.content.slice(-limits.listItems).forEach(c => sections.push(`- ${c}`))
   }
 
   return sections.join('\n')
 }
+
+// Render cache keyed by scratchpad identity. Every mutation helper returns
+// a new object, so identity equality means the content is unchanged — e.g.
+// when a pass yields no new markers, extractAndMerge returns the same
+// object and the next pass reuses the previous render instead of
+// rebuilding the whole context string.
+const skillPromptRenderCache = new WeakMap<Scratchpad, Map<number, string>>()
+
+/**
+ * Render scratchpad with essay for skill prompts
+ *
+ * Keeps the rendered context within a token budget: the full render is used
+ * when it fits, otherwise insight/counter lists are folded to their most
+ * recent entries and the essay is truncated before embedding.
+ */
+export function renderForSkillPrompt(
+  scratchpad: Scratchpad,
+  maxTokens: number = MAX_PROMPT_CONTEXT_TOKENS
+): string {
+  let byBudget = skillPromptRenderCache.get(scratchpad)
+  const cached = byBudget?.get(maxTokens)
+  if (cached !== undefined) {
+    return cached
+  }
+
+  const rendered = renderForSkillPromptUncached(scratchpad, maxTokens)
+  if (!byBudget) {
+    byBudget = new Map()
+    skillPromptRenderCache.set(scratchpad, byBudget)
+  }
+  byBudget.set(maxTokens, rendered)
+  return rendered
+}
+
+function renderForSkillPromptUncached(scratchpad: Scratchpad, maxTokens: number): string {
+  const full = buildSkillPromptSections(scratchpad, { listItems: Infinity, essayChars: Infinity })
+  if (Math.ceil(full.length / 4) <= maxTokens) {
+    return full
+  }
+
+  // Over budget: fold the cheap-to-lose content first (rule-based compression)
+  const compressed = buildSkillPromptSections(scratchpad, { listItems: 10, essayChars: 6000 })
+  if (Math.ceil(compressed.length / 4) <= maxTokens) {
+    return compressed
+  }
+
+  return buildSkillPromptSections(scratchpad, { listItems: 5, essayChars: 2000 })
+}
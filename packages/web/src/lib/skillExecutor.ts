@@ -10,12 +10,16 @@ import type { Skill, PassDefinition } from './skillLoader'
 import type { Scratchpad } from './scratchpad'
 import {
   extractAndMerge,
+  mergeExtractedMarkers,
   incrementCycle,
   renderForSkillPrompt,
+  scanMarkers,
   SEMANTIC_MARKERS,
+  type MarkerType,
 } from './scratchpad'
 import type { Claim } from './ingest'
 import type { Position } from './interview'
+import { saveScratchpadSnapshot, clearScratchpadSnapshot } from './storage'
 
 export interface ExecutionContext {
   scratchpad: Scratchpad
@@ -37,6 +41,7 @@ export interface PassResult {
   markers: MarkedContent[]
   essayDraft?: string
   tokensUsed?: number
+  durationMs?: number
 }
 
 export interface SkillResult {
@@ -52,6 +57,48 @@ export interface ExecutionCallbacks {
   onPassComplete?: (result: PassResult) => void
   onChunk?: (text: string) => void
   onError?: (error: string) => void
+  /**
+   * Consulted before each pass after the first; return false to stop the
+   * skill early and keep the passes completed so far. Lets callers skip
+   * passes that are redundant given the accumulated scratchpad state
+   * (e.g. a final polish pass when confidence has already saturated).
+   */
+  shouldContinue?: (completed: PassResult[], scratchpad: Scratchpad) => boolean
+}
+
+/**
+ * Incremental marker extraction over a streamed response.
+ *
+ * Marker content runs until the next '[' (or end of text), so everything
+ * before the last '[' seen so far is final and can be scanned while the
+ * model is still generating. Each region is scanned exactly once; finish()
+ * handles the remaining tail when the stream ends.
+ */
+export function createIncrementalMarkerExtractor(): {
+  push: (chunk: string) => void
+  finish: () => MarkedContent[]
+} {
+  let text = ''
+  let scannedUpTo = 0
+  const markers: MarkedContent[] = []
+
+  return {
+    push(chunk: string): void {
+      text += chunk
+      const cut = text.lastIndexOf('[')
+      if (cut > scannedUpTo) {
+        markers.push(...extractMarkers(text.slice(scannedUpTo, cut)))
+        scannedUpTo = cut
+      }
+    },
+    finish(): MarkedContent[] {
+      if (scannedUpTo < text.length) {
+        markers.push(...extractMarkers(text.slice(scannedUpTo)))
+        scannedUpTo = text.length
+      }
+      return markers
+    },
+  }
 }
 
 /**
@@ -60,36 +107,43 @@ export interface ExecutionCallbacks {
 export function extractMarkers(text: string): MarkedContent[] {
   const markers: MarkedContent[] = []
 
-  for (const [markerType, regex] of Object.entries(SEMANTIC_MARKERS)) {
-    const matches = text.matchAll(new RegExp(regex))
-    for (const match of matches) {
-      const content = match[1]?.trim()
-      if (content) {
-        markers.push({
-          type: markerType as keyof typeof SEMANTIC_MARKERS,
-          content,
-        })
-      }
+  // One alternation scan over the text instead of a full regex sweep per
+  // marker type; iterate in SEMANTIC_MARKERS order so the grouped output
+  // matches what the per-type sweeps produced
+  const byType = scanMarkers(text)
+  for (const markerType of Object.keys(SEMANTIC_MARKERS) as MarkerType[]) {
+    const contents = byType.get(markerType)
+    if (!contents) continue
+    for (const content of contents) {
+      markers.push({ type: markerType, content })
     }
   }
 
   return markers
 }
 
+// Every essay pattern anchors on one of these words; a single cheap test
+// lets the common no-essay pass skip the four capture scans below
+const ESSAY_HINT_REGEX = /essay|## draft/i
+
+// Compiled once at module load - extractEssayFromOutput runs after every pass
+const ESSAY_PATTERNS = [
+  /## Essay\s*\n([\s\S]*?)(?=##|$)/i,
+  /## Draft\s*\n([\s\S]*?)(?=##|$)/i,
+  /\[ESSAY\]([\s\S]*?)(?=\[|$)/i,
+  /---\s*essay\s*---\s*\n([\s\S]*?)(?=---|$)/i,
+]
+
 /**
  * Extract essay draft from output if present
  * Looks for ## Essay or similar markers
  */
 function extractEssayFromOutput(output: string): string | undefined {
-  // Look for essay section in output
-  const essayPatterns = [
-    /## Essay\s*\n([\s\S]*?)(?=##|$)/i,
-    /## Draft\s*\n([\s\S]*?)(?=##|$)/i,
-    /\[ESSAY\]([\s\S]*?)(?=\[|$)/i,
-    /---\s*essay\s*---\s*\n([\s\S]*?)(?=---|$)/i,
-  ]
-
-  for (const pattern of essayPatterns) {
+  if (!ESSAY_HINT_REGEX.test(output)) {
+    return undefined
+  }
+
+  for (const pattern of ESSAY_PATTERNS) {
     const match = output.match(pattern)
     if (match && match[1]?.trim()) {
       return match[1].trim()
@@ -99,23 +153,51 @@ function extractEssayFromOutput(output: string): string | undefined {
   return undefined
 }
 
+// Previous pass outputs are only ever fed back into prompts truncated;
+// keeping just the head avoids retaining every full output for the whole run
+const MAX_PREVIOUS_OUTPUT_LENGTH = 2000
+
 /**
- * Build the user prompt for a skill pass
+ * Build the per-run context for a pass: the static sections (source
+ * material, claim digest, user positions) followed by the rendered
+ * scratchpad.
+ *
+ * Sent as its own cached system block rather than inlined into the user
+ * prompt - it only changes when a pass actually merges new markers, so
+ * consecutive passes usually replay an identical prefix and get served
+ * from the provider-side prompt cache instead of re-paying prefill on
+ * several KB of context.
  */
-function buildPassPrompt(
+function buildPassContext(
   skill: Skill,
-  pass: PassDefinition,
   context: ExecutionContext,
-  previousOutputs: string[]
+  staticContext: string
 ): string {
   const parts: string[] = []
 
-  // Add scratchpad context
+  // Static material leads so its prefix stays cache-hot even on passes
+  // where the scratchpad did change
+  if (staticContext) {
+    parts.push(staticContext)
+  }
+
   const scratchpadContext = renderForSkillPrompt(context.scratchpad)
   if (scratchpadContext) {
     parts.push(scratchpadContext)
   }
 
+  return parts.join('\n')
+}
+
+/**
+ * Build the context sections that cannot change while a skill runs -
+ * source material, claim digest and user positions. Assembled once per
+ * executeSkill instead of once per pass; only the scratchpad render is
+ * per-pass work.
+ */
+function buildStaticPassContext(skill: Skill, context: ExecutionContext): string {
+  const parts: string[] = []
+
   // Add source material for GATHER stage
   if (skill.stage === 'gather' && context.sourceText) {
     parts.push('\n## Source Material')
@@ -132,13 +214,16 @@ function buildPassPrompt(
     parts.push('```')
   }
 
-  // Add claims for SHAPE/CRITIQUE/SYNTHESIZE stages
+  // Add claims for SHAPE/CRITIQUE/SYNTHESIZE stages as a compact digest:
+  // one line per claim, and the source quote only when it adds information
+  // the summary doesn't. The digest rides along on every pass of every
+  // skill, so its size is multiplied across the whole run.
   if (context.claims.length > 0 && skill.stage !== 'gather') {
-    parts.push('\n## Extracted Claims')
+    parts.push('\n## Extracted Claims (@id [type]: summary, quoted source where it differs)')
     context.claims.forEach(claim => {
-      parts.push(`@${claim.id}: ${claim.text} (${claim.type})`)
-      if (claim.snippet) {
-        parts.push(`  Quote: "${claim.snippet.slice(0, 200)}..."`)
+      parts.push(`@${claim.id} [${claim.type}]: ${claim.text}`)
+      if (claim.snippet && !claim.text.includes(claim.snippet.slice(0, 80))) {
+        parts.push(`  Quote: "${claim.snippet.slice(0, 200)}"`)
       }
     })
   }
@@ -156,31 +241,99 @@ function buildPassPrompt(
     })
   }
 
-  // Add previous pass outputs for context
+  return parts.join('\n')
+}
+
+// The task instruction block (name, purpose, marker list) is fixed by the
+// pass definition; render it once per pass object instead of re-assembling
+// the same lines on every cycle
+const passTaskBlockCache = new WeakMap<PassDefinition, string>()
+
+function passTaskBlock(pass: PassDefinition): string {
+  let block = passTaskBlockCache.get(pass)
+  if (block === undefined) {
+    const parts = [`\n## Current Task: ${pass.name}`, pass.purpose]
+    if (pass.markers.length > 0) {
+      parts.push(`\nUse these semantic markers in your response:`)
+      pass.markers.forEach(m => parts.push(`- [${m}] for ${m.toLowerCase()} content`))
+    }
+    block = parts.join('\n')
+    passTaskBlockCache.set(pass, block)
+  }
+  return block
+}
+
+/**
+ * Build the user prompt for a skill pass: the volatile remainder - prior
+ * pass outputs and the task instruction itself
+ */
+function buildPassPrompt(pass: PassDefinition, previousOutputs: string[]): string {
+  const parts: string[] = []
+
+  // Add previous pass outputs for context (already truncated at retention time)
   if (previousOutputs.length > 0) {
     parts.push('\n## Previous Pass Results')
     previousOutputs.forEach((output, i) => {
       parts.push(`### Pass ${i + 1} Output`)
-      // Summarize if too long
-      const maxOutput = 2000
-      parts.push(output.length > maxOutput
-        ? output.slice(0, maxOutput) + '\n[...]'
-        : output
-      )
+      parts.push(output)
     })
   }
 
-  // Add pass-specific instruction
-  parts.push(`\n## Current Task: ${pass.name}`)
-  parts.push(pass.purpose)
+  // Add pass-specific instruction and expected markers
+  parts.push(passTaskBlock(pass))
+
+  return parts.join('\n')
+}
+
+/**
+ * Run a progress callback off the critical path. Callbacks may trigger
+ * React state updates or logging; scheduling them as microtasks lets the
+ * next API call start immediately, and a throwing callback can no longer
+ * abort the run.
+ */
+function emitProgress(fn: (() => void) | false | undefined): void {
+  if (!fn) return
+  queueMicrotask(() => {
+    try {
+      fn()
+    } catch {
+      // Progress listeners must not break the pass pipeline
+    }
+  })
+}
 
-  // Add expected markers
-  if (pass.markers.length > 0) {
-    parts.push(`\nUse these semantic markers in your response:`)
-    pass.markers.forEach(m => parts.push(`- [${m}] for ${m.toLowerCase()} content`))
+// Opt-in pass profiling: set localStorage 'dialectic_profile' to '1' to
+// record a performance.measure per pass. Entries show up on the browser's
+// performance timeline, attributing wall time to individual passes without
+// adding any work when the flag is off.
+const PROFILING =
+  typeof localStorage !== 'undefined' && localStorage.getItem('dialectic_profile') === '1'
+
+// System prompts are identical across every pass of a skill (and across
+// runs); estimate their token count once and reuse the cached value
+const systemPromptTokenCache = new Map<string, number>()
+
+function estimateSystemPromptTokens(systemPrompt: string): number {
+  let tokens = systemPromptTokenCache.get(systemPrompt)
+  if (tokens === undefined) {
+    tokens = Math.ceil(systemPrompt.length / 4)
+    systemPromptTokenCache.set(systemPrompt, tokens)
   }
+  return tokens
+}
 
-  return parts.join('\n')
+// Fallback system prompts interned per skill so every pass of every cycle
+// sends the byte-identical string — a stable prefix is what lets the API's
+// prompt cache hit, and the interpolation isn't redone per pass
+const fallbackSystemPrompts = new Map<string, string>()
+
+function fallbackSystemPrompt(skillName: string): string {
+  let prompt = fallbackSystemPrompts.get(skillName)
+  if (prompt === undefined) {
+    prompt = `You are a dialectic analysis assistant executing the ${skillName} skill. Follow the pass instructions carefully.`
+    fallbackSystemPrompts.set(skillName, prompt)
+  }
+  return prompt
 }
 
 /**
@@ -190,29 +343,42 @@ async function executePass(
   skill: Skill,
   pass: PassDefinition,
   context: ExecutionContext,
+  staticContext: string,
   previousOutputs: string[],
   callbacks?: ExecutionCallbacks
 ): Promise<PassResult> {
-  callbacks?.onPassStart?.(pass.number, pass.name)
-
-  const systemPrompt = skill.systemPrompt || `You are a dialectic analysis assistant executing the ${skill.name} skill. Follow the pass instructions carefully.`
-  const userPrompt = buildPassPrompt(skill, pass, context, previousOutputs)
-
-  let output: string
+  emitProgress(callbacks?.onPassStart && (() => callbacks.onPassStart!(pass.number, pass.name)))
+
+  // Monotonic clock: unlike Date.now(), immune to wall-clock adjustments
+  // mid-pass, and no Date allocation per reading
+  const startedAt = performance.now()
+
+  const systemPrompt = skill.systemPrompt || fallbackSystemPrompt(skill.name)
+  const systemContext = buildPassContext(skill, context, staticContext)
+  const userPrompt = buildPassPrompt(pass, previousOutputs)
+
+  // Always stream: marker extraction overlaps with generation instead of
+  // waiting for the full multi-second completion, and UI callbacks (when
+  // present) get deltas for free
+  const extractor = createIncrementalMarkerExtractor()
+  const output = await makeStreamingCompletion(
+    systemPrompt,
+    userPrompt,
+    (chunk) => {
+      extractor.push(chunk)
+      callbacks?.onChunk?.(chunk)
+    },
+    systemContext ? { systemContext } : undefined
+  )
+
+  const markers = extractor.finish()
+  const essayDraft = extractEssayFromOutput(output)
 
-  if (callbacks?.onChunk) {
-    output = await makeStreamingCompletion(
-      systemPrompt,
-      userPrompt,
-      callbacks.onChunk
-    )
-  } else {
-    output = await makeCompletion(systemPrompt, userPrompt)
+  const endedAt = performance.now()
+  if (PROFILING) {
+    performance.measure(`${skill.name}/${pass.name}`, { start: startedAt, end: endedAt })
   }
 
-  const markers = extractMarkers(output)
-  const essayDraft = extractEssayFromOutput(output)
-
   const result: PassResult = {
     passNumber: pass.number,
     passName: pass.name,
@@ -220,10 +386,12 @@ async function executePass(
     markers,
     essayDraft,
     // Rough token estimate
-    tokensUsed: Math.ceil((systemPrompt.length + userPrompt.length + output.length) / 4),
+    tokensUsed: estimateSystemPromptTokens(systemPrompt) +
+      Math.ceil((systemContext.length + userPrompt.length + output.length) / 4),
+    durationMs: Math.round(endedAt - startedAt),
   }
 
-  callbacks?.onPassComplete?.(result)
+  emitProgress(callbacks?.onPassComplete && (() => callbacks.onPassComplete!(result)))
 
   return result
 }
@@ -236,26 +404,49 @@ export async function executeSkill(
   context: ExecutionContext,
   callbacks?: ExecutionCallbacks
 ): Promise<SkillResult> {
-  const passResults: PassResult[] = []
+  // Pass count is fixed by the skill definition, so size the results
+  // array up front and write by index instead of growing it per pass
+  const passResults: PassResult[] = new Array(skill.passes.length)
+  let completedPasses = 0
   let scratchpad = context.scratchpad
   const previousOutputs: string[] = []
 
+  // Claims, positions and source text are fixed for the whole run; build
+  // their digest once here rather than on every pass
+  const staticContext = buildStaticPassContext(skill, context)
+
   try {
     // Execute each pass sequentially
-    for (const pass of skill.passes) {
+    for (let i = 0; i < skill.passes.length; i++) {
+      if (i > 0 && callbacks?.shouldContinue &&
+          !callbacks.shouldContinue(passResults.slice(0, completedPasses), scratchpad)) {
+        break
+      }
+
+      const pass = skill.passes[i]
       const result = await executePass(
         skill,
         pass,
         { ...context, scratchpad },
+        staticContext,
         previousOutputs,
         callbacks
       )
 
-      passResults.push(result)
-      previousOutputs.push(result.output)
+      passResults[i] = result
+      completedPasses = i + 1
+      previousOutputs.push(result.output.length > MAX_PREVIOUS_OUTPUT_LENGTH
+        ? result.output.slice(0, MAX_PREVIOUS_OUTPUT_LENGTH) + '\n[...]'
+        : result.output
+      )
 
-      // Update scratchpad with markers from this pass
-      scratchpad = extractAndMerge(scratchpad, result.output)
+      // Merge the markers extracted while the response streamed in;
+      // no need to re-scan the full output text here. A pass that
+      // produced no markers has nothing to merge at all.
+      const beforeMerge = scratchpad
+      if (result.markers.length > 0) {
+        scratchpad = mergeExtractedMarkers(scratchpad, result.markers)
+      }
 
       // Update essay if this pass produced one
       if (result.essayDraft) {
@@ -265,29 +456,41 @@ export async function executeSkill(
           lastUpdated: Date.now(),
         }
       }
+
+      // Snapshot accumulated state so a mid-run failure doesn't lose
+      // the passes that already completed; skip the write when the pass
+      // changed nothing
+      if (scratchpad !== beforeMerge) {
+        saveScratchpadSnapshot(scratchpad)
+      }
     }
 
     // Increment cycle count
     scratchpad = incrementCycle(scratchpad)
 
-    // Get final output (last pass result)
-    const finalOutput = passResults.length > 0
-      ? passResults[passResults.length - 1].output
+    // Run completed - the snapshot is no longer needed for recovery
+    clearScratchpadSnapshot(scratchpad.sessionId)
+
+    // Get final output (last completed pass result)
+    const finalOutput = completedPasses > 0
+      ? passResults[completedPasses - 1].output
       : ''
 
     return {
       success: true,
-      passes: passResults,
+      passes: completedPasses === skill.passes.length
+        ? passResults
+        : passResults.slice(0, completedPasses),
       finalOutput,
       updatedScratchpad: scratchpad,
     }
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : 'Unknown error'
-    callbacks?.onError?.(errorMessage)
+    emitProgress(callbacks?.onError && (() => callbacks.onError!(errorMessage)))
 
     return {
       success: false,
-      passes: passResults,
+      passes: passResults.slice(0, completedPasses),
       finalOutput: '',
       updatedScratchpad: scratchpad,
       error: errorMessage,
@@ -306,15 +509,23 @@ export async function executeSinglePass(
   callbacks?: ExecutionCallbacks
 ): Promise<{ output: string; updatedScratchpad: Scratchpad }> {
   let output: string
+  let updatedScratchpad: Scratchpad
 
   if (callbacks?.onChunk) {
-    output = await makeStreamingCompletion(systemPrompt, userPrompt, callbacks.onChunk)
+    // Same overlap as executePass: markers are extracted while the
+    // response streams, leaving only the tail and the merge for after
+    // the last chunk
+    const extractor = createIncrementalMarkerExtractor()
+    output = await makeStreamingCompletion(systemPrompt, userPrompt, (chunk) => {
+      extractor.push(chunk)
+      callbacks.onChunk!(chunk)
+    })
+    updatedScratchpad = mergeExtractedMarkers(scratchpad, extractor.finish())
   } else {
     output = await makeCompletion(systemPrompt, userPrompt)
+    updatedScratchpad = extractAndMerge(scratchpad, output)
   }
 
-  const updatedScratchpad = extractAndMerge(scratchpad, output)
-
   return { output, updatedScratchpad }
 }
 
@@ -329,21 +540,24 @@ export function parseSkillOutput<T>(output: string): T | null {
   try {
     return JSON.parse(jsonStr) as T
   } catch {
-    // Try to find JSON array or object directly
-    const arrayMatch = jsonStr.match(/\[[\s\S]*\]/)
-    const objectMatch = jsonStr.match(/\{[\s\S]*\}/)
-
-    if (arrayMatch) {
+    // Try to find a JSON array or object directly. First/last bracket
+    // positions give the same greedy span the old [\s\S]* regexes
+    // matched, without a regex walk over the whole string.
+    const arrayStart = jsonStr.indexOf('[')
+    const arrayEnd = jsonStr.lastIndexOf(']')
+    if (arrayStart !== -1 && arrayEnd > arrayStart) {
       try {
-        return JSON.parse(arrayMatch[0]) as T
+        return JSON.parse(jsonStr.slice(arrayStart, arrayEnd + 1)) as T
       } catch {
         return null
       }
     }
 
-    if (objectMatch) {
+    const objectStart = jsonStr.indexOf('{')
+    const objectEnd = jsonStr.lastIndexOf('}')
+    if (objectStart !== -1 && objectEnd > objectStart) {
       try {
-        return JSON.parse(objectMatch[0]) as T
+        return JSON.parse(jsonStr.slice(objectStart, objectEnd + 1)) as T
       } catch {
         return null
       }
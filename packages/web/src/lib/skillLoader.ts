@@ -33,6 +33,10 @@ export interface Skill {
 // Cache loaded skills
 const skillCache = new Map<string, Skill>()
 
+// Raw markdown registered at startup, parsed lazily on first use so app
+// boot doesn't pay for regex-parsing stages the session may never reach
+const pendingDefinitions = new Map<Skill['stage'], string>()
+
 /**
  * Parse a skill markdown file into a Skill object
  */
@@ -83,12 +87,24 @@ export function parseSkillMarkdown(markdown: string, stage: Skill['stage']): Ski
   }
 }
 
+// Section-header patterns, compiled once per section name - the same few
+// names are looked up for every skill parsed
+const sectionHeaderRegexes = new Map<string, RegExp>()
+
+function sectionHeaderRegex(sectionName: string): RegExp {
+  let regex = sectionHeaderRegexes.get(sectionName)
+  if (!regex) {
+    regex = new RegExp(`^##\\s+${sectionName}\\s*$`, 'mi')
+    sectionHeaderRegexes.set(sectionName, regex)
+  }
+  return regex
+}
+
 /**
  * Extract a section by header name
  */
 function extractSection(markdown: string, sectionName: string): string {
-  const regex = new RegExp(`^##\\s+${sectionName}\\s*$`, 'mi')
-  const match = markdown.match(regex)
+  const match = markdown.match(sectionHeaderRegex(sectionName))
   if (!match || match.index === undefined) return ''
 
   const startIndex = match.index + match[0].length
@@ -221,7 +237,18 @@ function extractMarkersFromText(text: string): string[] {
  * In browser context, skills should be pre-loaded
  */
 export function getSkill(stage: Skill['stage']): Skill | null {
-  return skillCache.get(stage) || null
+  const cached = skillCache.get(stage)
+  if (cached) return cached
+
+  const markdown = pendingDefinitions.get(stage)
+  if (markdown) {
+    const skill = parseSkillMarkdown(markdown, stage)
+    pendingDefinitions.delete(stage)
+    registerSkill(skill)
+    return skill
+  }
+
+  return null
 }
 
 /**
@@ -235,6 +262,10 @@ export function registerSkill(skill: Skill): void {
  * Get all registered skills
  */
 export function getAllSkills(): Map<string, Skill> {
+  // Force-parse anything still pending so callers see every skill
+  for (const stage of [...pendingDefinitions.keys()]) {
+    getSkill(stage)
+  }
   return new Map(skillCache)
 }
 
@@ -243,6 +274,7 @@ export function getAllSkills(): Map<string, Skill> {
  */
 export function clearSkillCache(): void {
   skillCache.clear()
+  pendingDefinitions.clear()
 }
 
 // Pre-defined skill content for browser context
@@ -258,12 +290,14 @@ export const SKILL_DEFINITIONS: Record<Skill['stage'], string> = {
 /**
  * Initialize skills from embedded definitions
  * Call this on app startup
+ *
+ * Registration only records the markdown; parsing happens on the first
+ * getSkill for each stage.
  */
 export function initializeSkills(definitions: Record<Skill['stage'], string>): void {
   for (const [stage, markdown] of Object.entries(definitions)) {
     if (markdown) {
-      const skill = parseSkillMarkdown(markdown, stage as Skill['stage'])
-      registerSkill(skill)
+      pendingDefinitions.set(stage as Skill['stage'], markdown)
     }
   }
 }
@@ -9,12 +9,14 @@ import type { Tension } from './tensions'
 import type { DraftThesis } from './draft'
 import type { Thesis } from './synthesis'
 import type { ChatMessage, UserResponse } from '../components/Chat'
+import type { Scratchpad } from './scratchpad'
 
 const STORAGE_KEYS = {
   API_KEY: 'claude_api_key',
   SESSIONS: 'dialectic_sessions',
   USER_PROFILE: 'dialectic_user_profile',
   SESSION_DATA: 'dialectic_session_data',
+  SCRATCHPAD_SNAPSHOTS: 'dialectic_scratchpad_snapshots',
 } as const
 
 // --- User Profile Types ---
@@ -286,20 +288,28 @@ export function addProfileNote(content: string, source: 'user' | 'agent'): UserP
 
 // --- Session Data Management ---
 
+// Parsed-store cache: every accessor used to JSON.parse the whole store
+// (all sessions) per call, which grows linearly with accumulated sessions.
+// All reads and writes go through this module, so the parsed object stays
+// valid until the next save.
+let sessionDataCache: SessionDataStore | null = null
+
 function loadSessionDataStore(): SessionDataStore {
+  if (sessionDataCache) return sessionDataCache
   try {
     const data = localStorage.getItem(STORAGE_KEYS.SESSION_DATA)
-    if (!data) return {}
-    return JSON.parse(data)
+    sessionDataCache = data ? JSON.parse(data) : {}
   } catch {
     console.warn('Failed to load session data store')
     return {}
   }
+  return sessionDataCache!
 }
 
 function saveSessionDataStore(store: SessionDataStore): void {
   try {
     localStorage.setItem(STORAGE_KEYS.SESSION_DATA, JSON.stringify(store))
+    sessionDataCache = store
   } catch {
     console.warn('Failed to save session data store')
   }
@@ -322,6 +332,54 @@ export function deleteSessionData(sessionId: string): void {
   saveSessionDataStore(store)
 }
 
+// --- Scratchpad Snapshots ---
+//
+// Multi-pass skill runs are expensive (several Claude calls per skill); a
+// mid-run failure would otherwise throw away all accumulated analysis.
+// Snapshots are written after each completed pass so a re-run with the same
+// session can resume from the last good scratchpad instead of starting over.
+
+interface ScratchpadSnapshotStore {
+  [sessionId: string]: Scratchpad
+}
+
+function loadSnapshotStore(): ScratchpadSnapshotStore {
+  try {
+    const data = localStorage.getItem(STORAGE_KEYS.SCRATCHPAD_SNAPSHOTS)
+    if (!data) return {}
+    return JSON.parse(data)
+  } catch {
+    console.warn('Failed to load scratchpad snapshots')
+    return {}
+  }
+}
+
+export function saveScratchpadSnapshot(scratchpad: Scratchpad): void {
+  try {
+    const store = loadSnapshotStore()
+    store[scratchpad.sessionId] = scratchpad
+    localStorage.setItem(STORAGE_KEYS.SCRATCHPAD_SNAPSHOTS, JSON.stringify(store))
+  } catch {
+    console.warn('Failed to save scratchpad snapshot')
+  }
+}
+
+export function loadScratchpadSnapshot(sessionId: string): Scratchpad | null {
+  const store = loadSnapshotStore()
+  return store[sessionId] || null
+}
+
+export function clearScratchpadSnapshot(sessionId: string): void {
+  try {
+    const store = loadSnapshotStore()
+    if (!(sessionId in store)) return
+    delete store[sessionId]
+    localStorage.setItem(STORAGE_KEYS.SCRATCHPAD_SNAPSHOTS, JSON.stringify(store))
+  } catch {
+    console.warn('Failed to clear scratchpad snapshot')
+  }
+}
+
 export function getStorageUsage(): { used: number; available: number } {
   let used = 0
   for (const key in localStorage) {
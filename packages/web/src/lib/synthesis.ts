@@ -5,12 +5,14 @@
  * Now supports skill-driven SYNTHESIZE execution with final essay polish.
  */
 
-import { makeCompletion } from './claude'
+import { makeCompletion, makeStreamingCompletion } from './claude'
 import { parseSkillMarkdown, type Skill } from './skillLoader'
 import { executeSkill, parseSkillOutput, type ExecutionCallbacks } from './skillExecutor'
 import {
   setStage,
   updateConfidence,
+  updateEssay,
+  checkTermination,
   type Scratchpad,
 } from './scratchpad'
 import type { Claim } from './ingest'
@@ -43,15 +45,24 @@ export interface SessionData {
  * Pass 2: Convergent crystallization - select strongest thesis and structure evidence
  * Pass 3: Trigger generation - identify falsifiable conditions
  */
-export async function synthesizeThesis(session: SessionData): Promise<Thesis> {
+export async function synthesizeThesis(
+  session: SessionData,
+  onChunk?: (text: string) => void
+): Promise<Thesis> {
   // Build rich context from session data
   const context = buildSessionContext(session)
 
-  // Pass 1 + 2: Synthesis and crystallization in one call for efficiency
-  const synthesisPrompt = buildSynthesisPrompt()
-  const synthesisResult = await makeCompletion(synthesisPrompt, context, {
-    maxTokens: 3000,
-  })
+  // Pass 1 + 2: Synthesis and crystallization in one call for efficiency.
+  // Stream when the caller wants progress - synthesis is the longest
+  // single completion in the app, and time-to-first-token dominates how
+  // slow it feels.
+  const synthesisResult = onChunk
+    ? await makeStreamingCompletion(SYNTHESIS_SYSTEM_PROMPT, context, onChunk, {
+        maxTokens: 3000,
+      })
+    : await makeCompletion(SYNTHESIS_SYSTEM_PROMPT, context, {
+        maxTokens: 3000,
+      })
 
   // Parse the synthesis result
   const thesis = parseThesisResult(synthesisResult, session)
@@ -60,50 +71,49 @@ export async function synthesizeThesis(session: SessionData): Promise<Thesis> {
 }
 
 function buildSessionContext(session: SessionData): string {
-  const claimsSection = session.claims.map(c =>
-    `[${c.id}] (${c.type}): ${c.text}\n   Quote: "${c.snippet}"`
-  ).join('\n\n')
-
-  const positionsSection = session.positions.length > 0
-    ? session.positions.map(p => {
-        const claim = session.claims.find(c => c.id === p.claim_id)
-        return `- ${p.claim_id}: ${p.position_type}${p.elaboration ? ` - "${p.elaboration}"` : ''}${claim ? `\n  Claim: "${claim.text}"` : ''}`
-      }).join('\n')
-    : 'No explicit positions recorded.'
-
-  const tensionsSection = session.tensions.length > 0
-    ? session.tensions.map(t => {
-        const resolutionNote = t.resolved && t.resolution
-          ? `\n   RESOLVED: ${t.resolution}`
-          : '\n   UNRESOLVED'
-        return `[${t.id}]: ${t.description}
-   Side A: ${t.sides[0]}
-   Side B: ${t.sides[1]}
-   Claims: ${t.claim_refs.join(', ')}${resolutionNote}`
-      }).join('\n\n')
-    : 'No tensions identified.'
-
-  return `# Session: ${session.title}
-
-## Source Claims
-
-${claimsSection}
-
-## User Positions
-
-${positionsSection}
+  // Assemble via a parts list and a single join rather than nesting the
+  // per-section strings inside another multi-KB template copy
+  const parts: string[] = []
+
+  parts.push(`# Session: ${session.title}`)
+  parts.push('\n## Source Claims\n')
+  for (const c of session.claims) {
+    parts.push(`[${c.id}] (${c.type}): ${c.text}\n   Quote: "${c.snippet}"\n`)
+  }
 
-## Identified Tensions
+  parts.push('\n## User Positions\n')
+  if (session.positions.length > 0) {
+    const claimsById = new Map(session.claims.map(c => [c.id, c]))
+    for (const p of session.positions) {
+      const claim = claimsById.get(p.claim_id)
+      parts.push(`- ${p.claim_id}: ${p.position_type}${p.elaboration ? ` - "${p.elaboration}"` : ''}${claim ? `\n  Claim: "${claim.text}"` : ''}`)
+    }
+  } else {
+    parts.push('No explicit positions recorded.')
+  }
 
-${tensionsSection}
+  parts.push('\n## Identified Tensions\n')
+  if (session.tensions.length > 0) {
+    for (const t of session.tensions) {
+      const resolutionNote = t.resolved && t.resolution
+        ? `\n   RESOLVED: ${t.resolution}`
+        : '\n   UNRESOLVED'
+      parts.push(`[${t.id}]: ${t.description}
+   Side A: ${t.sides[0]}
+   Side B: ${t.sides[1]}
+   Claims: ${t.claim_refs.join(', ')}${resolutionNote}\n`)
+    }
+  } else {
+    parts.push('No tensions identified.')
+  }
 
----
+  parts.push('\n---\n')
+  parts.push('Synthesize a thesis from this session. The thesis should crystallize the user\'s developed position, incorporating how they resolved tensions and weighted evidence.')
 
-Synthesize a thesis from this session. The thesis should crystallize the user's developed position, incorporating how they resolved tensions and weighted evidence.`
+  return parts.join('\n')
 }
 
-function buildSynthesisPrompt(): string {
-  return `You are a thesis synthesis agent. Your task is to crystallize a user's dialectic session into a structured, testable thesis.
+const SYNTHESIS_SYSTEM_PROMPT = `You are a thesis synthesis agent. Your task is to crystallize a user's dialectic session into a structured, testable thesis.
 
 ## Multi-Pass Synthesis Process
 
@@ -181,7 +191,6 @@ Return ONLY valid JSON. No markdown, no explanation.
 3. Confidence anchoring: Not reflecting genuine uncertainty
 4. Missing mechanism: Correlation without causation
 5. Narrative fallacy: Coherent story masking confusion`
-}
 
 function parseThesisResult(result: string, session: SessionData): Thesis {
   let parsed: {
@@ -403,6 +412,10 @@ function getSynthesizeSkill(): Skill {
   return cachedSynthesizeSkill
 }
 
+// Output-parsing patterns, compiled once at module load
+const THESIS_JSON_REGEX = /## Thesis JSON[\s\S]*?```json\s*([\s\S]*?)```/i
+const FINAL_ESSAY_REGEX = /## Final Essay\s*([\s\S]*?)(?=##|$)/i
+
 /**
  * Execute SYNTHESIZE skill to produce final thesis and polished essay
  * Uses multi-pass execution with scratchpad accumulation
@@ -424,7 +437,16 @@ export async function executeSynthesizeSkill(
       claims: session.claims,
       positions: session.positions,
     },
-    callbacks
+    {
+      ...callbacks,
+      // Skip the final polish pass when confidence has already saturated
+      // and an essay draft exists - the crystallization output is already
+      // synthesis-quality at that point, so the extra call buys nothing
+      shouldContinue: (completed, scratchpadState) => {
+        if (completed.length < skill.passes.length - 1) return true
+        return !(scratchpadState.essay && checkTermination(scratchpadState) !== null)
+      },
+    }
   )
 
   if (!result.success) {
@@ -432,7 +454,7 @@ export async function executeSynthesizeSkill(
   }
 
   // Parse thesis JSON from output
-  const thesisMatch = result.finalOutput.match(/## Thesis JSON[\s\S]*?```json\s*([\s\S]*?)```/i)
+  const thesisMatch = result.finalOutput.match(THESIS_JSON_REGEX)
   let parsedThesis: {
     title?: string
     confidence?: number
@@ -471,7 +493,7 @@ export async function executeSynthesizeSkill(
   }))
 
   // Extract final essay markdown
-  const essayMatch = result.finalOutput.match(/## Final Essay\s*([\s\S]*?)(?=##|$)/i)
+  const essayMatch = result.finalOutput.match(FINAL_ESSAY_REGEX)
   let finalEssay = essayMatch ? essayMatch[1].trim() : ''
 
   // If no essay from skill, use scratchpad essay
@@ -480,7 +502,7 @@ export async function executeSynthesizeSkill(
   }
 
   // Update scratchpad with final essay and confidence
-  result.updatedScratchpad.essay = finalEssay
+  result.updatedScratchpad = updateEssay(result.updatedScratchpad, finalEssay)
   result.updatedScratchpad = updateConfidence(result.updatedScratchpad, thesis.confidence)
 
   // Build thesis document
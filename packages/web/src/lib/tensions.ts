@@ -12,6 +12,8 @@ import {
   setStage,
   addTension as addTensionToScratchpad,
   addUserQuote,
+  updateEssay,
+  checkTermination,
   type Scratchpad,
   type UserQuote,
 } from './scratchpad'
@@ -27,19 +29,7 @@ export interface Tension {
   resolution?: string
 }
 
-/**
- * Identify tensions from claims and user positions
- * Uses adversarial critique to find contradictions, frame conflicts, and commitment tensions
- */
-export async function identifyTensions(
-  claims: Claim[],
-  positions: Position[]
-): Promise<Tension[]> {
-  if (claims.length === 0) {
-    return []
-  }
-
-  const systemPrompt = `You are an adversarial critique agent. Your task is to identify tensions, contradictions, and unresolved conflicts in a user's positions on various claims.
+const TENSION_SYSTEM_PROMPT = `You are an adversarial critique agent. Your task is to identify tensions, contradictions, and unresolved conflicts in a user's positions on various claims.
 
 ## Your Role
 You must be GENUINELY adversarial, not performatively so. This means:
@@ -86,6 +76,18 @@ Return ONLY valid JSON array. No markdown, no explanation.
 - Avoid false tensions (positions that seem contradictory but aren't upon reflection)
 - Prioritize tensions that matter for decision-making`
 
+/**
+ * Identify tensions from claims and user positions
+ * Uses adversarial critique to find contradictions, frame conflicts, and commitment tensions
+ */
+export async function identifyTensions(
+  claims: Claim[],
+  positions: Position[]
+): Promise<Tension[]> {
+  if (claims.length === 0) {
+    return []
+  }
+
   // Build context from claims and positions
   const claimsContext = claims.map(c =>
     `[${c.id}] (${c.type}): ${c.text}\n   Quote: "${c.snippet}"`
@@ -118,8 +120,11 @@ Focus on:
 
 Return ONLY the JSON array.`
 
-  const response = await makeCompletion(systemPrompt, userPrompt, {
+  const response = await makeCompletion(TENSION_SYSTEM_PROMPT, userPrompt, {
     maxTokens: 2048,
+    // Both the critique-skill fallback and the manual critique command can
+    // invoke this with identical claims/positions; reuse the prior result
+    memoize: true,
   })
 
   // Parse JSON response
@@ -265,6 +270,50 @@ function getCritiqueSkill(): Skill {
   return cachedCritiqueSkill
 }
 
+// Output-parsing patterns, compiled once at module load
+const TENSIONS_SECTION_REGEX = /## Tensions[\s\S]*?```json\s*([\s\S]*?)```/i
+const REFINED_ESSAY_REGEX = /## Refined Essay\s*([\s\S]*?)(?=##|$)/i
+
+/**
+ * Fill in defaults for tensions parsed from skill output
+ */
+function normalizeTensions(parsed: Tension[] | null): Tension[] {
+  if (!Array.isArray(parsed)) return []
+  return parsed.map((t, i) => ({
+    id: t.id || `TENSION-${i + 1}`,
+    description: t.description || 'Unspecified tension',
+    sides: Array.isArray(t.sides) && t.sides.length >= 2
+      ? [t.sides[0], t.sides[1]] as [string, string]
+      : ['Side A not specified', 'Side B not specified'],
+    claim_refs: Array.isArray(t.claim_refs) ? t.claim_refs : [],
+    resolved: t.resolved === true,
+    resolution: t.resolution,
+  }))
+}
+
+/**
+ * Drop tensions with no real content and collapse near-duplicates.
+ *
+ * The model occasionally emits back-to-back markers with empty bodies, or
+ * restates the same conflict three ways. Placeholder and duplicate cards
+ * would otherwise count as "tensions found" and suppress the legacy
+ * fallback even though nothing usable was extracted.
+ */
+function substantiveTensions(tensions: Tension[]): Tension[] {
+  const seen = new Set<string>()
+  const kept: Tension[] = []
+  for (const tension of tensions) {
+    const description = tension.description.trim()
+    if (!description || description === 'Unspecified tension') continue
+    // Dedupe on a normalized prefix - restatements share their opening
+    const key = description.toLowerCase().slice(0, 30)
+    if (seen.has(key)) continue
+    seen.add(key)
+    kept.push(tension)
+  }
+  return kept
+}
+
 /**
  * Execute CRITIQUE skill to identify tensions AND refine essay
  * Uses multi-pass execution with scratchpad accumulation
@@ -300,7 +349,17 @@ export async function executeCritiqueSkill(
       claims,
       positions,
     },
-    callbacks
+    {
+      ...callbacks,
+      // Skip the essay-refinement pass when confidence has already
+      // saturated and a draft essay exists - at that point refinement
+      // reshuffles prose without changing the tensions, and each skipped
+      // pass is a full API round trip
+      shouldContinue: (completed, scratchpadState) => {
+        if (completed.length < skill.passes.length - 1) return true
+        return !(scratchpadState.essay && checkTermination(scratchpadState) !== null)
+      },
+    }
   )
 
   if (!result.success) {
@@ -308,23 +367,22 @@ export async function executeCritiqueSkill(
   }
 
   // Parse tensions from output
-  const tensionsMatch = result.finalOutput.match(/## Tensions[\s\S]*?```json\s*([\s\S]*?)```/i)
+  const tensionsMatch = result.finalOutput.match(TENSIONS_SECTION_REGEX)
   let tensions: Tension[] = []
 
   if (tensionsMatch) {
-    const parsed = parseSkillOutput<Tension[]>(tensionsMatch[1])
-    if (parsed) {
-      tensions = parsed.map((t, i) => ({
-        id: t.id || `TENSION-${i + 1}`,
-        description: t.description || 'Unspecified tension',
-        sides: Array.isArray(t.sides) && t.sides.length >= 2
-          ? [t.sides[0], t.sides[1]] as [string, string]
-          : ['Side A not specified', 'Side B not specified'],
-        claim_refs: Array.isArray(t.claim_refs) ? t.claim_refs : [],
-        resolved: t.resolved === true,
-        resolution: t.resolution,
-      }))
-    }
+    tensions = substantiveTensions(
+      normalizeTensions(parseSkillOutput<Tension[]>(tensionsMatch[1]))
+    )
+  }
+
+  // The model sometimes emits the tension JSON without the exact section
+  // header; try a headerless parse of the full output before paying for
+  // another complete API round trip
+  if (tensions.length === 0) {
+    tensions = substantiveTensions(
+      normalizeTensions(parseSkillOutput<Tension[]>(result.finalOutput))
+    )
   }
 
   // Fallback to legacy identification if skill parsing failed
@@ -341,7 +399,7 @@ export async function executeCritiqueSkill(
   }
 
   // Extract refined essay from output
-  const essayMatch = result.finalOutput.match(/## Refined Essay\s*([\s\S]*?)(?=##|$)/i)
+  const essayMatch = result.finalOutput.match(REFINED_ESSAY_REGEX)
   let refinedEssay = essayMatch ? essayMatch[1].trim() : ''
 
   // If no refined essay, keep the draft
@@ -351,8 +409,7 @@ export async function executeCritiqueSkill(
 
   // Update scratchpad with refined essay
   if (refinedEssay) {
-    result.updatedScratchpad.essay = refinedEssay
-    result.updatedScratchpad.lastUpdated = Date.now()
+    result.updatedScratchpad = updateEssay(result.updatedScratchpad, refinedEssay)
   }
 
   return {
@@ -173,6 +173,12 @@ export async function executeToolCall(
         const text = await response.text()
 
         if (contentType.includes('application/json')) {
+          // Only pretty-print bodies small enough to survive the cap.
+          // Indenting a large response allocates a string several times
+          // the payload size just to throw away everything past 5000 chars.
+          if (text.length > 5000) {
+            return `JSON response from ${url}:\n${text.slice(0, 5000)}`
+          }
           try {
             const json = JSON.parse(text)
             return `JSON response from ${url}:\n${JSON.stringify(json, null, 2).slice(0, 5000)}`
@@ -201,6 +201,16 @@ export function getThesesNeedingAttention(): ThesisDocument[] {
   return needsAttention
 }
 
+// Time-hint patterns and month table, hoisted out of the per-trigger loop
+const MONTH_HINT_REGEX = /by\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s*(\d{4})?/i
+const QUARTER_HINT_REGEX = /by\s+q([1-4])\s+(\d{4})/i
+const RELATIVE_HINT_REGEX = /within\s+(\d+)\s+(day|week|month|year)s?/i
+
+const MONTH_INDEX: Record<string, number> = {
+  january: 0, february: 1, march: 2, april: 3, may: 4, june: 5,
+  july: 6, august: 7, september: 8, october: 9, november: 10, december: 11,
+}
+
 /**
  * Check if any time-bound triggers are due
  */
@@ -215,18 +225,14 @@ export function checkTimeBoundTriggers(doc: ThesisDocument): Trigger[] {
     const condition = trigger.condition.toLowerCase()
 
     // Look for patterns like "by Q1 2026", "within 6 months", "by March"
-    const monthMatch = condition.match(/by\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s*(\d{4})?/i)
-    const quarterMatch = condition.match(/by\s+q([1-4])\s+(\d{4})/i)
-    const relativeMatch = condition.match(/within\s+(\d+)\s+(day|week|month|year)s?/i)
+    const monthMatch = condition.match(MONTH_HINT_REGEX)
+    const quarterMatch = condition.match(QUARTER_HINT_REGEX)
+    const relativeMatch = condition.match(RELATIVE_HINT_REGEX)
 
     let dueDate: Date | null = null
 
     if (monthMatch) {
-      const months: Record<string, number> = {
-        january: 0, february: 1, march: 2, april: 3, may: 4, june: 5,
-        july: 6, august: 7, september: 8, october: 9, november: 10, december: 11,
-      }
-      const month = months[monthMatch[1].toLowerCase()]
+      const month = MONTH_INDEX[monthMatch[1].toLowerCase()]
       const year = monthMatch[2] ? parseInt(monthMatch[2]) : now.getFullYear()
       dueDate = new Date(year, month + 1, 0) // Last day of month
     } else if (quarterMatch) {
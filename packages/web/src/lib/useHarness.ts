@@ -44,6 +44,16 @@ const RECONNECT_DELAY_MS = 2000
 const MAX_RECONNECT_ATTEMPTS = 3
 const PING_INTERVAL_MS = 30000
 
+// Per-event logging serializes payload objects for every message on the
+// hot path - dozens per run - for output nobody reads outside debugging.
+// Opt in via localStorage when diagnosing; errors always log.
+const DEBUG_LOGGING =
+  typeof localStorage !== 'undefined' && localStorage.getItem('harness_debug') === '1'
+
+function debugLog(...args: unknown[]): void {
+  if (DEBUG_LOGGING) console.log(...args)
+}
+
 // =============================================================================
 // TYPES
 // =============================================================================
@@ -164,20 +174,20 @@ export function useHarness(): UseHarnessReturn {
 
     // Discriminated union type narrowing via isHarnessEvent guard
     if (isHarnessEvent(parsed, 'initialized')) {
-      console.log('[useHarness] Harness initialized:', parsed.data)
+      debugLog('[useHarness] Harness initialized:', parsed.data)
       setState((prev) => ({
         ...prev,
         status: 'running',
       }))
     } else if (isHarnessEvent(parsed, 'cycle_start')) {
-      console.log('[useHarness] Cycle started:', parsed.data.cycle)
+      debugLog('[useHarness] Cycle started:', parsed.data.cycle)
       setState((prev) => ({
         ...prev,
         currentCycle: parsed.data.cycle,
         currentPass: 'expansion', // First pass of a cycle is expansion
       }))
     } else if (isHarnessEvent(parsed, 'expansion_complete')) {
-      console.log('[useHarness] Expansion complete:', parsed.data)
+      debugLog('[useHarness] Expansion complete:', parsed.data)
       setState((prev) => ({
         ...prev,
         currentPass: 'compression', // Next pass after expansion
@@ -186,7 +196,7 @@ export function useHarness(): UseHarnessReturn {
         tokensUsed: prev.tokensUsed + parsed.data.tokens,
       }))
     } else if (isHarnessEvent(parsed, 'compression_complete')) {
-      console.log('[useHarness] Compression complete:', parsed.data)
+      debugLog('[useHarness] Compression complete:', parsed.data)
       setState((prev) => ({
         ...prev,
         currentPass: 'critique', // Next pass after compression
@@ -195,7 +205,7 @@ export function useHarness(): UseHarnessReturn {
         tokensUsed: prev.tokensUsed + parsed.data.tokens,
       }))
     } else if (isHarnessEvent(parsed, 'critique_complete')) {
-      console.log('[useHarness] Critique complete:', parsed.data)
+      debugLog('[useHarness] Critique complete:', parsed.data)
       setState((prev) => ({
         ...prev,
         currentPass: null, // End of cycle, waiting for next cycle_start or synthesis
@@ -204,7 +214,7 @@ export function useHarness(): UseHarnessReturn {
         tokensUsed: prev.tokensUsed + parsed.data.tokens,
       }))
     } else if (isHarnessEvent(parsed, 'synthesis_complete')) {
-      console.log('[useHarness] Synthesis complete:', parsed.data)
+      debugLog('[useHarness] Synthesis complete:', parsed.data)
       setState((prev) => ({
         ...prev,
         currentPass: 'synthesis',
@@ -213,10 +223,10 @@ export function useHarness(): UseHarnessReturn {
         tokensUsed: prev.tokensUsed + parsed.data.tokens,
       }))
     } else if (isHarnessEvent(parsed, 'terminating')) {
-      console.log('[useHarness] Terminating:', parsed.data.reason)
+      debugLog('[useHarness] Terminating:', parsed.data.reason)
       // Don't change status yet - wait for complete event
     } else if (isHarnessEvent(parsed, 'complete')) {
-      console.log('[useHarness] Harness complete:', parsed.data)
+      debugLog('[useHarness] Harness complete:', parsed.data)
       const result: HarnessResult = {
         sessionId: parsed.data.session_id,
         title: parsed.data.title,
@@ -235,9 +245,11 @@ export function useHarness(): UseHarnessReturn {
         result,
         currentPass: null,
       }))
-      // Close connection after completion
+      // Keep the socket open after completion: the backend accepts multiple
+      // run commands per connection, so the next start() skips the TCP +
+      // WebSocket handshake. Disable reconnects while idle; the unmount
+      // cleanup still closes it.
       shouldReconnectRef.current = false
-      closeConnection()
     } else if (isHarnessEvent(parsed, 'error')) {
       console.error('[useHarness] Harness error:', parsed.data.message)
       const error: ApiError = {
@@ -279,13 +291,13 @@ export function useHarness(): UseHarnessReturn {
    * Handle WebSocket close
    */
   const handleClose = useCallback((event: CloseEvent) => {
-    console.log('[useHarness] WebSocket closed:', event.code, event.reason)
+    debugLog('[useHarness] WebSocket closed:', event.code, event.reason)
     clearPingInterval()
 
     // Check if we should attempt reconnection
     if (shouldReconnectRef.current && reconnectAttemptsRef.current < MAX_RECONNECT_ATTEMPTS) {
       reconnectAttemptsRef.current++
-      console.log(`[useHarness] Attempting reconnect ${reconnectAttemptsRef.current}/${MAX_RECONNECT_ATTEMPTS}`)
+      debugLog(`[useHarness] Attempting reconnect ${reconnectAttemptsRef.current}/${MAX_RECONNECT_ATTEMPTS}`)
 
       setState((prev) => ({
         ...prev,
@@ -318,20 +330,27 @@ export function useHarness(): UseHarnessReturn {
    * Connect to WebSocket and send run command
    */
   const connect = useCallback((command: HarnessRunCommand) => {
-    // Close existing connection if any
+    // Reuse a healthy connection left open by a previous run
+    if (wsRef.current?.readyState === WebSocket.OPEN) {
+      debugLog('[useHarness] Reusing open WebSocket connection')
+      wsRef.current.send(JSON.stringify(command))
+      return
+    }
+
+    // Close any half-open connection before dialing fresh
     if (wsRef.current) {
       wsRef.current.close()
     }
 
     const wsUrl = getWsUrl()
-    console.log('[useHarness] Connecting to:', wsUrl)
+    debugLog('[useHarness] Connecting to:', wsUrl)
 
     try {
       const ws = new WebSocket(wsUrl)
       wsRef.current = ws
 
       ws.onopen = () => {
-        console.log('[useHarness] WebSocket connected')
+        debugLog('[useHarness] WebSocket connected')
         reconnectAttemptsRef.current = 0
         startPingInterval()
 